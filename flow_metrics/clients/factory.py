@@ -1,29 +1,55 @@
 """Client factory module."""
 
+import os
+from functools import lru_cache
+
 from flow_metrics.clients.musicbrainz import MusicBrainzClient
 from flow_metrics.clients.musixmatch import MusixmatchClient
 from flow_metrics.clients.spotify import SpotifyClient
-from flow_metrics.config.settings import get_settings
+from flow_metrics.config.settings import Settings, get_settings
+from flow_metrics.http.disk_cache import DiskCache
+
+
+def _disk_cache(settings: Settings, name: str, ttl: int) -> DiskCache | None:
+    """Create a persistent response cache in the configured cache directory.
+
+    Args:
+        settings: Application settings
+        name: Name of the cache file, without extension
+        ttl: Seconds before cached responses expire (0 disables the cache)
+
+    Returns:
+        Disk cache, or None if disabled
+    """
+    if ttl <= 0:
+        return None
+    return DiskCache(os.path.join(settings.cache_dir, f"{name}.sqlite3"), ttl)
 
 
+@lru_cache
 def create_spotify_client() -> SpotifyClient:
-    """Create a Spotify client using app settings.
+    """Create a Spotify client using app settings, cached for reuse.
 
     Returns:
-        Initialized Spotify client
+        Initialized Spotify client, shared by every caller in the process
     """
     settings = get_settings()
     return SpotifyClient(
         client_id=settings.spotify_client_id,
         client_secret=settings.spotify_client_secret,
+        # Stay under Spotify's rolling rate limit; 429s are retried after Retry-After
+        rate_limit_per_second=10.0,
+        rate_limit_burst=2,
+        disk_cache=_disk_cache(settings, "spotify", settings.spotify_cache_ttl),
     )
 
 
+@lru_cache
 def create_musicbrainz_client() -> MusicBrainzClient:
-    """Create a MusicBrainz client using app settings.
+    """Create a MusicBrainz client using app settings, cached for reuse.
 
     Returns:
-        Initialized MusicBrainz client
+        Initialized MusicBrainz client, shared by every caller in the process
     """
     settings = get_settings()
     return MusicBrainzClient(
@@ -31,14 +57,16 @@ def create_musicbrainz_client() -> MusicBrainzClient:
         app_version=settings.musicbrainz_version,
         contact_info=settings.musicbrainz_contact,
         rate_limit=1.0,  # Respect MusicBrainz rate limit of 1 request per second
+        disk_cache=_disk_cache(settings, "musicbrainz", settings.musicbrainz_cache_ttl),
     )
 
 
+@lru_cache
 def create_musixmatch_client() -> MusixmatchClient:
-    """Create a Musixmatch client using app settings.
+    """Create a Musixmatch client using app settings, cached for reuse.
 
     Returns:
-        Initialized Musixmatch client
+        Initialized Musixmatch client, shared by every caller in the process
     """
     settings = get_settings()
     return MusixmatchClient(api_key=settings.musixmatch_api_key)
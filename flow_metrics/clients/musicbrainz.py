@@ -1,9 +1,11 @@
 """MusicBrainz API client."""
 
-import time
 from typing import Any
 
+import orjson
+
 from flow_metrics.http.client import HeaderAdder, HttpClient
+from flow_metrics.http.disk_cache import DiskCache
 from flow_metrics.models.musicbrainz import (
     CoverArtResponse,
     MusicBrainzArtist,
@@ -35,6 +37,7 @@ class MusicBrainzClient:
         app_version: str,
         contact_info: str,
         rate_limit: float = 1.0,
+        disk_cache: DiskCache | None = None,
     ) -> None:
         """Initialize the MusicBrainz client.
 
@@ -43,35 +46,39 @@ class MusicBrainzClient:
             app_version: Application version for User-Agent
             contact_info: Contact information (email or URL) for User-Agent
             rate_limit: Time in seconds between requests (default: 1.0)
+            disk_cache: Persistent cache for API responses (None to always fetch)
         """
         self.app_name = app_name
         self.app_version = app_version
         self.contact_info = contact_info
         self.rate_limit = rate_limit
-        self.last_request_time: float | None = None
 
         # Create HTTP client with custom User-Agent
         self.user_agent = f"{app_name}/{app_version} ( {contact_info} )"
         headers = {"User-Agent": self.user_agent}
 
-        self.client = HttpClient(base_url=self.BASE_URL)
+        # Requests are spaced out by the HTTP clients, which also back off and
+        # retry when MusicBrainz answers 503 because the limit was exceeded
+        rate_limit_per_second = 1.0 / rate_limit if rate_limit > 0 else None
+        self.client = HttpClient(
+            base_url=self.BASE_URL,
+            rate_limit_per_second=rate_limit_per_second,
+            cache=True,
+            disk_cache=disk_cache,
+        )
         header_adder = HeaderAdder(self.client, headers)
         header_adder.add_headers()
 
         # Create separate client for Cover Art Archive
-        self.cover_art_client = HttpClient(base_url=self.COVER_ART_URL)
+        self.cover_art_client = HttpClient(
+            base_url=self.COVER_ART_URL,
+            rate_limit_per_second=rate_limit_per_second,
+            cache=True,
+            disk_cache=disk_cache,
+        )
         header_adder = HeaderAdder(self.cover_art_client, headers)
         header_adder.add_headers()
 
-    def _respect_rate_limit(self) -> None:
-        """Ensure we respect the MusicBrainz rate limit."""
-        if self.last_request_time is not None:
-            elapsed = time.time() - self.last_request_time
-            if elapsed < self.rate_limit:
-                time.sleep(self.rate_limit - elapsed)
-
-        self.last_request_time = time.time()
-
     def _make_request(
         self,
         endpoint: str,
@@ -94,12 +101,9 @@ class MusicBrainzClient:
         if "fmt" not in params:
             params["fmt"] = "json"
 
-        # Respect rate limit
-        self._respect_rate_limit()
-
         try:
             response = self.client.get(endpoint, params=params)
-            return response.json()
+            return orjson.loads(response.content)
         except Exception as e:
             raise MusicBrainzError(f"API request failed: {str(e)}") from e
 
@@ -584,13 +588,9 @@ class MusicBrainzClient:
         Raises:
             MusicBrainzError: If getting cover art fails
         """
-        # Respect rate limit
-        self._respect_rate_limit()
-
         try:
             # The Cover Art Archive API doesn't use the /ws/2 prefix
-            response = self.cover_art_client.get(f"/release/{release_id}")
-            return CoverArtResponse.model_validate(response.json())
+            return self.cover_art_client.get_json_model(f"/release/{release_id}", CoverArtResponse)
         except Exception as e:
             raise MusicBrainzError(f"Failed to get cover art: {str(e)}") from e
 
@@ -781,14 +781,15 @@ class MusicBrainzClient:
         similar_artists: list[MusicBrainzArtist] = []
 
         # Look for similarity relationships
-        if not getattr(artist, "relations", None):
+        if not artist.relations:
             return similar_artists
 
-        if artist.relations is not None:
-            for relation in artist.relations:
-                if relation.type in ["similar", "influenced by", "influence"] and relation.artist:
-                    artist_data = relation.artist
-                    similar_artist = MusicBrainzArtist.model_validate(artist_data)
-                    similar_artists.append(similar_artist)
+        for relation in artist.relations:
+            if relation.type in ["similar", "influenced by", "influence"] and relation.artist:
+                similar_artist = MusicBrainzArtist.model_validate(
+                    relation.artist,
+                    from_attributes=True,
+                )
+                similar_artists.append(similar_artist)
 
         return similar_artists
@@ -1,6 +1,8 @@
 """Musixmatch API client."""
 
-from typing import Any
+import functools
+from collections.abc import Callable
+from typing import Any, ParamSpec, TypeVar
 
 from flow_metrics.http.client import HttpClient
 from flow_metrics.models.musixmatch import (
@@ -10,6 +12,36 @@ from flow_metrics.models.musixmatch import (
     MusixmatchTrack,
 )
 
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+def _wrap_errors(message: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Wrap unexpected exceptions raised by a client method in a MusixmatchError.
+
+    MusixmatchErrors raised by the method are propagated unchanged.
+
+    Args:
+        message: Prefix for the wrapped error message
+
+    Returns:
+        Decorator applying the error wrapping
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            try:
+                return func(*args, **kwargs)
+            except MusixmatchError:
+                raise
+            except Exception as e:
+                raise MusixmatchError(f"{message}: {str(e)}") from e
+
+        return wrapper
+
+    return decorator
+
 
 class MusixmatchClient:
     """
@@ -28,6 +60,7 @@ class MusixmatchClient:
         self.api_key = api_key
         self.client = HttpClient(base_url=self.BASE_URL)
 
+    @_wrap_errors("Request failed")
     def _make_request(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
         """Make a request to the Musixmatch API.
 
@@ -45,24 +78,18 @@ class MusixmatchClient:
         params = params or {}
         params["apikey"] = self.api_key
 
-        try:
-            response = self.client.get(endpoint, params=params)
-            data = response.json()
-
-            # Check for errors in response
-            status_code = data.get("message", {}).get("header", {}).get("status_code", 0)
-            if status_code != 200:
-                error_message = (
-                    data.get("message", {}).get("header", {}).get("hint", "Unknown error")
-                )
-                raise MusixmatchError(f"API error: {error_message}", status_code=status_code)
-
-            return data
-        except Exception as e:
-            if isinstance(e, MusixmatchError):
-                raise
-            raise MusixmatchError(f"Request failed: {str(e)}") from e
+        response = self.client.get(endpoint, params=params)
+        data = response.json()
+
+        # Check for errors in response
+        status_code = data.get("message", {}).get("header", {}).get("status_code", 0)
+        if status_code != 200:
+            error_message = data.get("message", {}).get("header", {}).get("hint", "Unknown error")
+            raise MusixmatchError(f"API error: {error_message}", status_code=status_code)
+
+        return data
 
+    @_wrap_errors("Artist search failed")
     def search_artist(self, name: str, page: int = 1, page_size: int = 5) -> list[MusixmatchArtist]:
         """Search for artists.
 
@@ -83,16 +110,12 @@ class MusixmatchClient:
             "page_size": min(page_size, 100),
         }
 
-        try:
-            data = self._make_request("/artist.search", params)
-            artist_list = data.get("message", {}).get("body", {}).get("artist_list", [])
+        data = self._make_request("/artist.search", params)
+        artist_list = data.get("message", {}).get("body", {}).get("artist_list", [])
 
-            return [MusixmatchArtist.model_validate(item.get("artist", {})) for item in artist_list]
-        except Exception as e:
-            if isinstance(e, MusixmatchError):
-                raise
-            raise MusixmatchError(f"Artist search failed: {str(e)}") from e
+        return [MusixmatchArtist.model_validate(item.get("artist", {})) for item in artist_list]
 
+    @_wrap_errors("Track search failed")
     def search_tracks(
         self,
         query: str = "",
@@ -129,16 +152,12 @@ class MusixmatchClient:
         if track_name:
             params["q_track"] = track_name
 
-        try:
-            data = self._make_request("/track.search", params)
-            track_list = data.get("message", {}).get("body", {}).get("track_list", [])
+        data = self._make_request("/track.search", params)
+        track_list = data.get("message", {}).get("body", {}).get("track_list", [])
 
-            return [MusixmatchTrack.model_validate(item.get("track", {})) for item in track_list]
-        except Exception as e:
-            if isinstance(e, MusixmatchError):
-                raise
-            raise MusixmatchError(f"Track search failed: {str(e)}") from e
+        return [MusixmatchTrack.model_validate(item.get("track", {})) for item in track_list]
 
+    @_wrap_errors("Failed to get artist tracks")
     def get_artist_tracks(
         self,
         artist_id: int,
@@ -165,16 +184,12 @@ class MusixmatchClient:
             "s_track_rating": "desc",  # Sort by rating
         }
 
-        try:
-            data = self._make_request("/track.search", params)
-            track_list = data.get("message", {}).get("body", {}).get("track_list", [])
+        data = self._make_request("/track.search", params)
+        track_list = data.get("message", {}).get("body", {}).get("track_list", [])
 
-            return [MusixmatchTrack.model_validate(item.get("track", {})) for item in track_list]
-        except Exception as e:
-            if isinstance(e, MusixmatchError):
-                raise
-            raise MusixmatchError(f"Failed to get artist tracks: {str(e)}") from e
+        return [MusixmatchTrack.model_validate(item.get("track", {})) for item in track_list]
 
+    @_wrap_errors("Failed to get track lyrics")
     def get_track_lyrics(self, track_id: int) -> MusixmatchLyrics:
         """Get lyrics for a track.
 
@@ -191,15 +206,10 @@ class MusixmatchClient:
             "track_id": track_id,
         }
 
-        try:
-            data = self._make_request("/track.lyrics.get", params)
-            lyrics_data = data.get("message", {}).get("body", {}).get("lyrics", {})
+        data = self._make_request("/track.lyrics.get", params)
+        lyrics_data = data.get("message", {}).get("body", {}).get("lyrics", {})
 
-            return MusixmatchLyrics.model_validate(lyrics_data)
-        except Exception as e:
-            if isinstance(e, MusixmatchError):
-                raise
-            raise MusixmatchError(f"Failed to get track lyrics: {str(e)}") from e
+        return MusixmatchLyrics.model_validate(lyrics_data)
 
     def get_all_artist_tracks(self, artist_id: int, limit: int = 50) -> list[MusixmatchTrack]:
         """Get all tracks by an artist (handles pagination).
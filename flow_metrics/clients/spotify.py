@@ -1,10 +1,12 @@
 """Spotify API client."""
 
 import base64
+import time
 from datetime import UTC, datetime, timedelta
 from typing import Any, cast
 
 from flow_metrics.http.client import HeaderAdder, HttpClient
+from flow_metrics.http.disk_cache import DiskCache
 from flow_metrics.models.spotify import (
     AlbumTracksResponse,
     ArtistAlbumsResponse,
@@ -17,6 +19,7 @@ from flow_metrics.models.spotify import (
     SpotifyToken,
     SpotifyTrack,
 )
+from flow_metrics.utils.helpers import build_page_params
 
 
 class SpotifyClient:
@@ -27,23 +30,43 @@ class SpotifyClient:
 
     BASE_URL = "https://api.spotify.com/v1"
     AUTH_URL = "https://accounts.spotify.com/api/token"
+    MAX_PAGE_SIZE = 50  # Maximum allowed by Spotify API
 
-    def __init__(self, client_id: str, client_secret: str) -> None:
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        rate_limit_per_second: float | None = None,
+        rate_limit_burst: int = 1,
+        disk_cache: DiskCache | None = None,
+    ) -> None:
         """Initialize the Spotify client.
 
         Args:
             client_id: Spotify API client ID
             client_secret: Spotify API client secret
+            rate_limit_per_second: Maximum API requests per second (None for no limit)
+            rate_limit_burst: API requests that may be sent back to back after an idle period
+            disk_cache: Persistent cache for API responses (None to always fetch)
         """
         self.client_id = client_id
         self.client_secret = client_secret
         self.token: SpotifyToken | None = None
+        # Monotonic deadline for the current token, so freshness checks on every
+        # request are a float comparison rather than a timezone-aware datetime
+        self._token_deadline = 0.0
 
         # Create a separate HTTP client for auth requests
         self.auth_client = HttpClient(base_url="https://accounts.spotify.com")
 
-        # Create main API client
-        self.client = HttpClient(base_url=self.BASE_URL)
+        # Create main API client, revalidating repeat lookups with ETags
+        self.client = HttpClient(
+            base_url=self.BASE_URL,
+            rate_limit_per_second=rate_limit_per_second,
+            rate_limit_burst=rate_limit_burst,
+            cache=True,
+            disk_cache=disk_cache,
+        )
 
     def _encode_credentials(self) -> str:
         """Encode client credentials for auth header.
@@ -63,7 +86,7 @@ class SpotifyClient:
         Raises:
             SpotifyError: If authentication fails
         """
-        if self.token and self.token.expires_at and self.token.expires_at > datetime.now(UTC):
+        if self.token and self._token_is_valid():
             # Token is still valid
             return self.token
 
@@ -90,6 +113,7 @@ class SpotifyClient:
 
             # Create token object
             self.token = SpotifyToken(**token_data)
+            self._token_deadline = time.monotonic() + self.token.expires_in
 
             # Update API client headers
             api_headers = {"Authorization": f"Bearer {self.token.access_token}"}
@@ -101,13 +125,17 @@ class SpotifyClient:
         except Exception as e:
             raise SpotifyError(f"Authentication failed: {str(e)}") from e
 
+    def _token_is_valid(self) -> bool:
+        """Check whether the current token has not yet expired.
+
+        Returns:
+            True if a token is held and still within its lifetime
+        """
+        return self.token is not None and time.monotonic() < self._token_deadline
+
     def _ensure_auth(self) -> None:
         """Ensure the client is authenticated before making a request."""
-        if (
-            not self.token
-            or not self.token.expires_at
-            or self.token.expires_at <= datetime.now(UTC)
-        ):
+        if not self._token_is_valid():
             self.authenticate()
 
     def search_artists(self, query: str, limit: int = 10, offset: int = 0) -> list[SpotifyArtist]:
@@ -132,7 +160,7 @@ class SpotifyClient:
                 params={
                     "q": query,
                     "type": "artist",
-                    "limit": min(limit, 50),  # Max 50 per Spotify API
+                    "limit": min(limit, self.MAX_PAGE_SIZE),
                     "offset": offset,
                 },
             )
@@ -158,8 +186,7 @@ class SpotifyClient:
         self._ensure_auth()
 
         try:
-            response = self.client.get(f"/artists/{artist_id}")
-            return SpotifyArtist.model_validate(response.json())
+            return self.client.get_json_model(f"/artists/{artist_id}", SpotifyArtist)
 
         except Exception as e:
             raise SpotifyError(f"Failed to get artist: {str(e)}") from e
@@ -189,20 +216,20 @@ class SpotifyClient:
         """
         self._ensure_auth()
 
-        params: dict[str, Any] = {
-            "limit": min(limit, 50),  # Max 50 per Spotify API
-            "offset": offset,
-        }
-
-        if album_types:
-            params["include_groups"] = ",".join(album_types)
-
-        if market:
-            params["market"] = market
+        params = build_page_params(
+            limit,
+            offset,
+            self.MAX_PAGE_SIZE,
+            include_groups=",".join(album_types) if album_types else None,
+            market=market,
+        )
 
         try:
-            response = self.client.get(f"/artists/{artist_id}/albums", params=params)
-            return ArtistAlbumsResponse.model_validate(response.json())
+            return self.client.get_json_model(
+                f"/artists/{artist_id}/albums",
+                ArtistAlbumsResponse,
+                params=params,
+            )
 
         except Exception as e:
             raise SpotifyError(f"Failed to get artist albums: {str(e)}") from e
@@ -222,13 +249,10 @@ class SpotifyClient:
         """
         self._ensure_auth()
 
-        params: dict[str, Any] = {}
-        if market:
-            params["market"] = market
+        params: dict[str, Any] = {"market": market} if market else {}
 
         try:
-            response = self.client.get(f"/albums/{album_id}", params=params)
-            return SpotifyAlbum.model_validate(response.json())
+            return self.client.get_json_model(f"/albums/{album_id}", SpotifyAlbum, params=params)
 
         except Exception as e:
             raise SpotifyError(f"Failed to get album: {str(e)}") from e
@@ -256,17 +280,14 @@ class SpotifyClient:
         """
         self._ensure_auth()
 
-        params: dict[str, Any] = {
-            "limit": min(limit, 50),  # Max 50 per Spotify API
-            "offset": offset,
-        }
-
-        if market:
-            params["market"] = market
+        params = build_page_params(limit, offset, self.MAX_PAGE_SIZE, market=market)
 
         try:
-            response = self.client.get(f"/albums/{album_id}/tracks", params=params)
-            return AlbumTracksResponse.model_validate(response.json())
+            return self.client.get_json_model(
+                f"/albums/{album_id}/tracks",
+                AlbumTracksResponse,
+                params=params,
+            )
 
         except Exception as e:
             raise SpotifyError(f"Failed to get album tracks: {str(e)}") from e
@@ -286,13 +307,10 @@ class SpotifyClient:
         """
         self._ensure_auth()
 
-        params: dict[str, Any] = {}
-        if market:
-            params["market"] = market
+        params: dict[str, Any] = {"market": market} if market else {}
 
         try:
-            response = self.client.get(f"/tracks/{track_id}", params=params)
-            return SpotifyTrack.model_validate(response.json())
+            return self.client.get_json_model(f"/tracks/{track_id}", SpotifyTrack, params=params)
 
         except Exception as e:
             raise SpotifyError(f"Failed to get track: {str(e)}") from e
@@ -366,7 +384,7 @@ class SpotifyClient:
             SpotifyError: If getting albums fails
         """
         offset = 0
-        limit = 50  # Maximum allowed by Spotify API
+        limit = self.MAX_PAGE_SIZE
         all_albums: list[SpotifyAlbumSimplified] = []
 
         while True:
@@ -406,7 +424,7 @@ class SpotifyClient:
             SpotifyError: If getting tracks fails
         """
         offset = 0
-        limit = 50  # Maximum allowed by Spotify API
+        limit = self.MAX_PAGE_SIZE
         all_tracks: list[SpotifyTrack] = []
 
         while True:
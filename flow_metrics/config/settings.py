@@ -34,10 +34,28 @@ class Settings(BaseSettings):
     mongo_uri: str = Field(..., description="MongoDB connection URI")
     mongo_db: str = Field(..., description="MongoDB database name")
     mongo_collection: str = Field(..., description="MongoDB collection name")
+    mongo_max_pool_size: int = Field(50, description="Maximum connections per MongoDB server")
+    mongo_min_pool_size: int = Field(5, description="Connections kept open when idle")
+    mongo_max_connecting: int = Field(4, description="Connections that may be opened at once")
+    mongo_max_idle_time_ms: int = Field(60_000, description="Idle time before a connection closes")
+    mongo_socket_timeout_ms: int = Field(20_000, description="MongoDB socket timeout")
+    mongo_connect_timeout_ms: int = Field(10_000, description="MongoDB connection timeout")
+    mongo_compressors: str = Field(
+        "zlib",
+        description="Comma-separated wire compressors in order of preference (zstd, snappy, zlib)",
+    )
 
     # Application settings
     log_level: str = Field("INFO", description="Logging level")
     cache_dir: str = Field(".cache", description="Directory for caching API responses")
+    spotify_cache_ttl: int = Field(
+        86_400,
+        description="Seconds to reuse cached Spotify responses (0 disables the cache)",
+    )
+    musicbrainz_cache_ttl: int = Field(
+        604_800,
+        description="Seconds to reuse cached MusicBrainz responses (0 disables the cache)",
+    )
 
     model_config = SettingsConfigDict(
         env_file=".env",
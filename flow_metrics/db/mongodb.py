@@ -1,12 +1,91 @@
 """MongoDB utilities for Flow Metrics."""
 
+import atexit
+import re
+import threading
+from collections.abc import Iterator
 from typing import Any
 
-from pymongo import MongoClient
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel, MongoClient, UpdateOne
+from pymongo.collation import Collation
 from pymongo.collection import Collection
+from pymongo.errors import OperationFailure
+from pymongo.write_concern import WriteConcern
 
 from flow_metrics.config.settings import get_settings
 
+# Case-insensitive comparison; queries must use it to be served by the *_ci indexes
+CASE_INSENSITIVE = Collation(locale="en", strength=2)
+
+# Documents fetched per round trip when streaming query results
+FIND_BATCH_SIZE = 500
+
+# Indexes backing artist lookups, filters and upserts
+ARTIST_INDEXES = [
+    IndexModel([("spotify_id", ASCENDING)], unique=True, name="spotify_id_unique"),
+    IndexModel([("name", ASCENDING)], name="name"),
+    IndexModel([("name", ASCENDING)], name="name_ci", collation=CASE_INSENSITIVE),
+    # Word search on names; no language so names are neither stemmed nor
+    # stripped of stop words
+    IndexModel([("name", TEXT)], name="name_text", default_language="none"),
+    # Also serves genre-only queries through its prefix
+    IndexModel([("genres", ASCENDING), ("name", ASCENDING)], name="genres_name"),
+    IndexModel([("genres", ASCENDING)], name="genres_ci", collation=CASE_INSENSITIVE),
+    # Only index artists with a popularity score
+    IndexModel(
+        [("spotify_popularity", DESCENDING)],
+        name="spotify_popularity",
+        partialFilterExpression={"spotify_popularity": {"$type": "number"}},
+    ),
+]
+
+# Collections whose indexes have already been ensured by this process,
+# keyed by (uri, database name, collection name)
+_indexed_collections: set[tuple[str, str, str]] = set()
+
+# Shared MongoClients keyed by URI. MongoClient is thread-safe and owns its own
+# connection pool, so one per process avoids repeating discovery and auth handshakes.
+_client_cache: dict[str, MongoClient] = {}
+_client_cache_lock = threading.Lock()
+
+
+def get_mongo_client(uri: str) -> MongoClient:
+    """Get the shared MongoClient for a URI, creating it on first use.
+
+    Args:
+        uri: MongoDB connection URI
+
+    Returns:
+        MongoClient configured from the application settings
+    """
+    with _client_cache_lock:
+        client = _client_cache.get(uri)
+        if client is None:
+            settings = get_settings()
+            client = MongoClient(
+                uri,
+                maxPoolSize=settings.mongo_max_pool_size,
+                minPoolSize=settings.mongo_min_pool_size,
+                maxConnecting=settings.mongo_max_connecting,
+                maxIdleTimeMS=settings.mongo_max_idle_time_ms,
+                socketTimeoutMS=settings.mongo_socket_timeout_ms,
+                connectTimeoutMS=settings.mongo_connect_timeout_ms,
+                compressors=settings.mongo_compressors,
+                retryWrites=True,
+                w=1,
+            )
+            _client_cache[uri] = client
+        return client
+
+
+@atexit.register
+def close_mongo_clients() -> None:
+    """Close every shared MongoClient."""
+    with _client_cache_lock:
+        for client in _client_cache.values():
+            client.close()
+        _client_cache.clear()
+
 
 class MongoDBClient:
     """MongoDB client for Flow Metrics data storage."""
@@ -29,9 +108,27 @@ class MongoDBClient:
         self.db_name = db_name or settings.mongo_db
         self.default_collection = collection_name or settings.mongo_collection
 
-        self.client = MongoClient(self.uri)
+        self.client = get_mongo_client(self.uri)
         self.db = self.client[self.db_name]
 
+    def ensure_indexes(self, collection_name: str | None = None) -> None:
+        """Create the indexes backing artist lookups and upserts.
+
+        Called by the scripts that write artists and by name searches, which need
+        the name text index. Index creation is idempotent on the server, but it is
+        only sent once per collection per process.
+
+        Args:
+            collection_name: Collection name (if None, uses default)
+        """
+        name = collection_name or self.default_collection
+        key = (self.uri, self.db_name, name)
+        if key in _indexed_collections:
+            return
+
+        self.get_collection(name).create_indexes(ARTIST_INDEXES)
+        _indexed_collections.add(key)
+
     def get_collection(self, collection_name: str | None = None) -> Collection:
         """Get a MongoDB collection.
 
@@ -61,6 +158,39 @@ class MongoDBClient:
         result = collection.insert_one(artist_data)
         return str(result.inserted_id)
 
+    def insert_many_artists(
+        self,
+        artists: list[dict[str, Any]],
+        collection_name: str | None = None,
+        ordered: bool = False,
+        batch_size: int = 1000,
+        write_concern: WriteConcern | None = None,
+    ) -> list[str]:
+        """Insert multiple artists into MongoDB in batches.
+
+        Args:
+            artists: Artist data to insert
+            collection_name: Collection name (if None, uses default)
+            ordered: If True, stop at the first failed insert; otherwise keep inserting
+                the remaining documents of the batch
+            batch_size: Maximum number of documents sent per insert_many call
+            write_concern: Optional write concern for the inserts, e.g.
+                WriteConcern(w=1, j=False) for low-durability bulk loads
+
+        Returns:
+            IDs of the inserted documents
+        """
+        collection = self.get_collection(collection_name)
+        if write_concern is not None:
+            collection = collection.with_options(write_concern=write_concern)
+
+        inserted_ids: list[str] = []
+        for start in range(0, len(artists), batch_size):
+            result = collection.insert_many(artists[start : start + batch_size], ordered=ordered)
+            inserted_ids.extend(str(inserted_id) for inserted_id in result.inserted_ids)
+
+        return inserted_ids
+
     def update_artist(
         self,
         spotify_id: str,
@@ -100,81 +230,298 @@ class MongoDBClient:
         """
         collection = self.get_collection(collection_name)
 
-        # Check if artist already exists
-        existing = collection.find_one({"spotify_id": artist_data["spotify_id"]})
+        # Single atomic upsert instead of a lookup followed by an insert or update
+        result = collection.update_one(
+            {"spotify_id": artist_data["spotify_id"]},
+            {"$set": artist_data},
+            upsert=True,
+        )
 
-        if existing:
-            # Update existing document
-            result = collection.update_one(
-                {"spotify_id": artist_data["spotify_id"]},
-                {"$set": artist_data},
-            )
+        if result.upserted_id is not None:
             return {
-                "operation": "update",
-                "modified_count": result.modified_count,
-                "_id": existing["_id"],
+                "operation": "insert",
+                "inserted_id": result.upserted_id,
             }
-        # Insert new document
-        result = collection.insert_one(artist_data)
         return {
-            "operation": "insert",
-            "inserted_id": result.inserted_id,
+            "operation": "update",
+            "modified_count": result.modified_count,
+        }
+
+    def bulk_upsert_artists(
+        self,
+        artists: list[dict[str, Any]],
+        collection_name: str | None = None,
+    ) -> dict[str, int]:
+        """Insert or update multiple artists in a single bulk write.
+
+        Args:
+            artists: Artist data, each containing a spotify_id
+            collection_name: Collection name (if None, uses default)
+
+        Returns:
+            Dictionary with counts of inserted, matched and modified documents
+        """
+        if not artists:
+            return {"inserted_count": 0, "matched_count": 0, "modified_count": 0}
+
+        collection = self.get_collection(collection_name)
+        result = collection.bulk_write(
+            [
+                UpdateOne({"spotify_id": artist["spotify_id"]}, {"$set": artist}, upsert=True)
+                for artist in artists
+            ],
+            ordered=False,
+        )
+        return {
+            "inserted_count": result.upserted_count,
+            "matched_count": result.matched_count,
+            "modified_count": result.modified_count,
         }
 
     def find_artist_by_spotify_id(
         self,
         spotify_id: str,
         collection_name: str | None = None,
+        projection: dict[str, Any] | None = None,
     ) -> dict[str, Any] | None:
         """Find artist by Spotify ID.
 
         Args:
             spotify_id: Spotify artist ID
             collection_name: Collection name (if None, uses default)
+            projection: Fields to include or exclude (if None, returns whole documents)
 
         Returns:
             Artist data or None if not found
         """
         collection = self.get_collection(collection_name)
-        return collection.find_one({"spotify_id": spotify_id})
+        return collection.find_one({"spotify_id": spotify_id}, projection)
+
+    def find_existing_spotify_ids(
+        self,
+        spotify_ids: list[str],
+        collection_name: str | None = None,
+    ) -> set[str]:
+        """Find which of the given Spotify IDs are already stored.
+
+        Uses a single $in query answered from the spotify_id index.
+
+        Args:
+            spotify_ids: Spotify artist IDs to check
+            collection_name: Collection name (if None, uses default)
+
+        Returns:
+            The subset of IDs that exist in the collection
+        """
+        if not spotify_ids:
+            return set()
+
+        collection = self.get_collection(collection_name)
+        cursor = collection.find(
+            {"spotify_id": {"$in": spotify_ids}},
+            {"spotify_id": 1, "_id": 0},
+        )
+        return {document["spotify_id"] for document in cursor}
+
+    def _find(
+        self,
+        query: dict[str, Any],
+        collection_name: str | None = None,
+        projection: dict[str, Any] | None = None,
+        limit: int | None = None,
+        skip: int = 0,
+        collation: Collation | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Run a find query, streaming the results in batches.
+
+        Args:
+            query: Query filter
+            collection_name: Collection name (if None, uses default)
+            projection: Fields to include or exclude (if None, returns whole documents)
+            limit: Maximum number of documents (if None, no limit)
+            skip: Number of matching documents to skip
+            collation: Collation for string comparisons
+
+        Returns:
+            Cursor over the matching documents
+        """
+        collection = self.get_collection(collection_name)
+        return collection.find(
+            query,
+            projection,
+            skip=skip,
+            limit=limit or 0,
+            batch_size=FIND_BATCH_SIZE,
+            collation=collation,
+        )
+
+    def name_filter(self, name: str, collection_name: str | None = None) -> dict[str, Any]:
+        """Build a query matching artist names that contain the given words.
+
+        The name is searched as one phrase through the name text index, so every
+        word must appear in order. Only whole words match: "kendr" does not find
+        "Kendrick Lamar". The index is ensured first; if it is missing and cannot
+        be created (no createIndex privilege, or the collection already has another
+        text index), a case-insensitive substring regex is used instead, which
+        scans the collection but still matches partial words.
+
+        Args:
+            name: Words from the artist name
+            collection_name: Collection name (if None, uses default)
+
+        Returns:
+            Query filter on the artist name
+        """
+        try:
+            self.ensure_indexes(collection_name)
+        except OperationFailure:
+            index_names = self.get_collection(collection_name).index_information()
+            if "name_text" not in index_names:
+                return {"name": {"$regex": re.escape(name), "$options": "i"}}
+
+        phrase = name.replace('"', " ")
+        return {"$text": {"$search": f'"{phrase}"'}}
 
     def find_artist_by_name(
         self,
         name: str,
         collection_name: str | None = None,
-    ) -> list[dict[str, Any]]:
+        exact: bool = False,
+        projection: dict[str, Any] | None = None,
+        limit: int | None = None,
+        skip: int = 0,
+    ) -> Iterator[dict[str, Any]]:
         """Find artists by name (case-insensitive).
 
+        Results are fetched from the server in batches as the iterator is consumed.
+
         Args:
-            name: Artist name
+            name: Artist name, or words from it unless exact is set
             collection_name: Collection name (if None, uses default)
+            exact: If True, match the whole name using the case-insensitive index;
+                otherwise match names containing the given words in order (e.g.
+                "lamar" also matches "Kendrick Lamar"); partial words only match
+                when the name text index is unavailable (see name_filter)
+            projection: Fields to include or exclude (if None, returns whole documents)
+            limit: Maximum number of artists (if None, no limit)
+            skip: Number of matching artists to skip
+
+        Returns:
+            Iterator over matching artists
+        """
+        if exact:
+            query: dict[str, Any] = {"name": name}
+            return self._find(
+                query,
+                collection_name,
+                projection,
+                limit,
+                skip,
+                collation=CASE_INSENSITIVE,
+            )
+
+        return self._find(
+            self.name_filter(name, collection_name),
+            collection_name,
+            projection,
+            limit,
+            skip,
+        )
+
+    def find_artist_by_name_list(self, name: str, **kwargs: Any) -> list[dict[str, Any]]:
+        """Find artists by name, returning all matches as a list.
+
+        Args:
+            name: Artist name, or words from it unless exact is set
+            **kwargs: Additional arguments for find_artist_by_name
 
         Returns:
             List of matching artists
         """
-        collection = self.get_collection(collection_name)
-        return list(collection.find({"name": {"$regex": name, "$options": "i"}}))
+        return list(self.find_artist_by_name(name, **kwargs))
 
     def find_artists_by_genre(
         self,
         genre: str,
         collection_name: str | None = None,
-    ) -> list[dict[str, Any]]:
+        exact: bool = False,
+        projection: dict[str, Any] | None = None,
+        limit: int | None = None,
+        skip: int = 0,
+    ) -> Iterator[dict[str, Any]]:
         """Find artists by genre (case-insensitive).
 
+        Results are fetched from the server in batches as the iterator is consumed.
+
         Args:
             genre: Genre to search for
             collection_name: Collection name (if None, uses default)
+            exact: If True, match whole genre names using the case-insensitive index;
+                otherwise match genres containing the given text (e.g. "hip hop"
+                also matches "east coast hip hop")
+            projection: Fields to include or exclude (if None, returns whole documents)
+            limit: Maximum number of artists (if None, no limit)
+            skip: Number of matching artists to skip
+
+        Returns:
+            Iterator over matching artists
+        """
+        if exact:
+            query: dict[str, Any] = {"genres": genre}
+            return self._find(
+                query,
+                collection_name,
+                projection,
+                limit,
+                skip,
+                collation=CASE_INSENSITIVE,
+            )
+
+        query = {"genres": {"$regex": re.escape(genre), "$options": "i"}}
+        return self._find(query, collection_name, projection, limit, skip)
+
+    def find_artists_by_genre_list(self, genre: str, **kwargs: Any) -> list[dict[str, Any]]:
+        """Find artists by genre, returning all matches as a list.
+
+        Args:
+            genre: Genre to search for
+            **kwargs: Additional arguments for find_artists_by_genre
 
         Returns:
             List of matching artists
         """
-        collection = self.get_collection(collection_name)
-        return list(collection.find({"genres": {"$regex": genre, "$options": "i"}}))
+        return list(self.find_artists_by_genre(genre, **kwargs))
+
+    def explain_plan(
+        self,
+        query: dict[str, Any],
+        collection_name: str | None = None,
+    ) -> dict[str, Any]:
+        """Explain how MongoDB executes a find query.
+
+        Useful for checking a query is served by an index (IXSCAN) rather than a
+        collection scan (COLLSCAN).
+
+        Args:
+            query: Query filter
+            collection_name: Collection name (if None, uses default)
+
+        Returns:
+            Explain output with execution statistics
+        """
+        name = collection_name or self.default_collection
+        return self.db.command(
+            "explain",
+            {"find": name, "filter": query},
+            verbosity="executionStats",
+        )
 
     def count_artists(self, collection_name: str | None = None) -> int:
         """Count the number of artists in the collection.
 
+        Uses the count from collection metadata rather than scanning, so it may be
+        approximate after an unclean shutdown.
+
         Args:
             collection_name: Collection name (if None, uses default)
 
@@ -182,4 +529,4 @@ class MongoDBClient:
             Number of artists
         """
         collection = self.get_collection(collection_name)
-        return collection.count_documents({})
+        return collection.estimated_document_count()
@@ -0,0 +1,89 @@
+"""Response caching for HTTP clients."""
+
+import threading
+from collections import OrderedDict
+from typing import Any
+
+import httpx
+
+CacheKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+class ResponseCache:
+    """Thread-safe LRU cache of GET responses for conditional revalidation.
+
+    Only responses carrying an ETag or Last-Modified validator are stored. The
+    client revalidates them with If-None-Match / If-Modified-Since and reuses
+    the cached response when the server answers 304 Not Modified.
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of responses to keep
+        """
+        self.maxsize = maxsize
+        self._entries: OrderedDict[CacheKey, httpx.Response] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(path: str, params: dict[str, Any] | None = None) -> CacheKey:
+        """Build the cache key for a request.
+
+        Args:
+            path: URL path of the request
+            params: Query parameters of the request
+
+        Returns:
+            Key independent of query parameter order
+        """
+        return path, tuple(sorted((name, str(value)) for name, value in (params or {}).items()))
+
+    @staticmethod
+    def conditional_headers(response: httpx.Response) -> dict[str, str]:
+        """Build the headers revalidating a cached response.
+
+        Args:
+            response: Cached response
+
+        Returns:
+            If-None-Match and/or If-Modified-Since headers
+        """
+        headers = {}
+        if "ETag" in response.headers:
+            headers["If-None-Match"] = response.headers["ETag"]
+        if "Last-Modified" in response.headers:
+            headers["If-Modified-Since"] = response.headers["Last-Modified"]
+        return headers
+
+    def get(self, key: CacheKey) -> httpx.Response | None:
+        """Get a cached response, marking it as recently used.
+
+        Args:
+            key: Cache key from ResponseCache.key
+
+        Returns:
+            Cached response or None
+        """
+        with self._lock:
+            response = self._entries.get(key)
+            if response is not None:
+                self._entries.move_to_end(key)
+            return response
+
+    def put(self, key: CacheKey, response: httpx.Response) -> None:
+        """Store a response if it can be revalidated.
+
+        Args:
+            key: Cache key from ResponseCache.key
+            response: Successful response
+        """
+        if not self.conditional_headers(response):
+            return
+
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
@@ -1,7 +1,57 @@
 """HTTP client module."""
-from typing import Any, Dict, Optional
+import asyncio
+import time
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from types import TracebackType
+from typing import Any, TypeVar
 
-import requests
+import httpx
+from pydantic import BaseModel
+
+from flow_metrics.http.cache import ResponseCache
+from flow_metrics.http.disk_cache import DiskCache
+from flow_metrics.http.rate_limit import RateLimiter
+
+DEFAULT_USER_AGENT = "FlowMetrics/1.0 (brett.plemons@gmail.com)"
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Statuses indicating the server is throttling or temporarily unavailable
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# Upper bound on a single wait, so a bad Retry-After cannot stall a worker
+MAX_RETRY_DELAY = 60.0
+# Seconds an idle connection stays pooled; longer than httpx's 5 second default
+# so connections survive the pauses between rate-limited requests
+KEEPALIVE_EXPIRY = 30.0
+
+
+def retry_delay(response: httpx.Response, attempt: int, backoff_factor: float) -> float:
+    """Work out how long to wait before retrying a throttled request.
+
+    Honors the Retry-After header (delay in seconds or an HTTP date) and falls
+    back to exponential backoff when the server does not send one.
+
+    Args:
+        response: Response with a retryable status
+        attempt: Number of retries already made for the request
+        backoff_factor: Base delay in seconds for exponential backoff
+
+    Returns:
+        Delay in seconds
+    """
+    retry_after = response.headers.get("Retry-After")
+    delay = backoff_factor * (2**attempt)
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                delay = (retry_at - datetime.now(UTC)).total_seconds()
+            except (TypeError, ValueError):
+                pass
+    return min(max(delay, 0.0), MAX_RETRY_DELAY)
 
 
 class HttpClient:
@@ -11,29 +61,144 @@ class HttpClient:
     with proper error handling and request configuration.
     """
 
-    def __init__(self, base_url: str, headers: Optional[Dict[str, str]] = None) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        headers: dict[str, str] | None = None,
+        http2: bool = True,
+        max_connections: int = 10,
+        keepalive_expiry: float = KEEPALIVE_EXPIRY,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        rate_limit_per_second: float | None = None,
+        rate_limit_burst: int = 1,
+        cache: bool = False,
+        cache_size: int = 4096,
+        disk_cache: DiskCache | None = None,
+    ) -> None:
         """Initialize the HTTP client with a base URL and optional headers.
         
         Args:
             base_url: The base URL for all requests
             headers: Optional headers to include with all requests
+            http2: Negotiate HTTP/2 so concurrent requests share one connection
+                (falls back to HTTP/1.1 for hosts that do not support it)
+            max_connections: Maximum number of pooled connections to the host
+            keepalive_expiry: Seconds an idle connection is kept open for reuse
+            max_retries: Number of times to retry a request that fails to connect
+                or is throttled (429, 502, 503, 504)
+            backoff_factor: Base delay in seconds between throttled retries when
+                the server sends no Retry-After header
+            rate_limit_per_second: Maximum requests per second (None for no limit)
+            rate_limit_burst: Requests that may be sent back to back after an idle period
+            cache: Keep GET responses that carry an ETag or Last-Modified header and
+                revalidate them instead of downloading them again
+            cache_size: Maximum number of cached responses
+            disk_cache: Persistent cache answering repeat GETs without a request
+                until its entries expire
         """
         self.base_url = base_url
-        # Add a User-Agent header
-        default_headers = {
-            "User-Agent": "FlowMetrics/1.0 (brett.plemons@gmail.com)" 
-        }
-        # Merge with any provided headers
-        self.headers = headers if headers is not None else default_headers
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.rate_limiter = (
+            RateLimiter(rate_limit_per_second, rate_limit_burst)
+            if rate_limit_per_second is not None
+            else None
+        )
+        self.cache = ResponseCache(cache_size) if cache else None
+        self.disk_cache = disk_cache
+        # Copy the defaults and any provided headers into a case-insensitive
+        # mapping owned by this client, so HeaderAdder never mutates the caller's
+        # dict or headers shared with another client
+        self.headers = httpx.Headers({"User-Agent": DEFAULT_USER_AGENT, **(headers or {})})
+        # Keep a persistent connection pool instead of connecting per request. With
+        # HTTP/2, concurrent requests are multiplexed over a single connection.
+        transport = httpx.HTTPTransport(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            retries=max_retries,
+        )
+        self.session = httpx.Client(transport=transport)
+
+    def close(self) -> None:
+        """Close the underlying connection pool."""
+        self.session.close()
+
+    def __enter__(self) -> "HttpClient":
+        """Enter a context that closes the client on exit."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the client when leaving the context."""
+        self.close()
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        timeout: int = 30,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """Send an HTTP request without checking the response status.
+
+        Applies the rate limit and retries throttled responses.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: URL path to append to base_url
+            params: Optional query parameters
+            json: Optional JSON body
+            timeout: Request timeout in seconds
+            headers: Optional headers for this request only
+
+        Returns:
+            Response object
+        """
+        url = f"{self.base_url}{path}"
+        request_headers = self.headers
+        if headers:
+            request_headers = self.headers.copy()
+            request_headers.update(headers)
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+
+            response = self.session.request(
+                method,
+                url,
+                headers=request_headers,
+                params=params,
+                json=json,
+                timeout=timeout,
+            )
+
+            if response.status_code in RETRY_STATUSES and attempt < self.max_retries:
+                time.sleep(retry_delay(response, attempt, self.backoff_factor))
+                attempt += 1
+                continue
+
+            return response
 
     def _request(
         self,
         method: str,
         path: str,
-        params: Optional[Dict[str, Any]] = None,
-        json: Optional[Dict[str, Any]] = None,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
         timeout: int = 30,
-    ) -> requests.Response:
+    ) -> httpx.Response:
         """Make an HTTP request.
         
         Args:
@@ -47,24 +212,24 @@ class HttpClient:
             Response object
             
         Raises:
-            requests.HTTPError: For 4xx and 5xx responses
+            httpx.HTTPStatusError: For 4xx and 5xx responses, once retries of
+                throttled requests are exhausted
         """
-        url = f"{self.base_url}{path}"
-        response = requests.request(
-            method,
-            url,
-            headers=self.headers,
-            params=params,
-            json=json,
-            timeout=timeout,
-        )
+        response = self._send(method, path, params=params, json=json, timeout=timeout)
         response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
         return response
 
     def get(
-        self, path: str, params: Optional[Dict[str, Any]] = None, timeout: int = 30
-    ) -> requests.Response:
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        timeout: int = 30,
+    ) -> httpx.Response:
         """Make a GET request.
+
+        With a disk cache, a response stored within its time to live is returned
+        without making a request. With caching enabled, a previously seen response
+        is revalidated and returned as-is when the server answers 304 Not Modified.
         
         Args:
             path: URL path to append to base_url
@@ -74,15 +239,60 @@ class HttpClient:
         Returns:
             Response object
         """
-        return self._request("GET", path, params=params, timeout=timeout)
+        disk_key = None
+        if self.disk_cache is not None:
+            disk_key = DiskCache.key(f"{self.base_url}{path}", params)
+            body = self.disk_cache.get(disk_key)
+            if body is not None:
+                request = httpx.Request("GET", f"{self.base_url}{path}", params=params)
+                return httpx.Response(200, content=body, request=request)
+
+        if self.cache is None:
+            response = self._request("GET", path, params=params, timeout=timeout)
+        else:
+            key = ResponseCache.key(path, params)
+            cached = self.cache.get(key)
+            response = self._send(
+                "GET",
+                path,
+                params=params,
+                timeout=timeout,
+                headers=ResponseCache.conditional_headers(cached) if cached is not None else None,
+            )
+            if response.status_code == 304 and cached is not None:
+                response = cached
+            else:
+                response.raise_for_status()
+                self.cache.put(key, response)
+
+        if self.disk_cache is not None and disk_key is not None:
+            self.disk_cache.put(disk_key, response.content)
+        return response
+
+    def get_json_model(self, path: str, model: type[ModelT], **kwargs: Any) -> ModelT:
+        """Make a GET request and validate the JSON body into a model.
+
+        The raw body is handed straight to pydantic-core, which parses and
+        validates in one pass without building an intermediate dict.
+
+        Args:
+            path: URL path to append to base_url
+            model: Pydantic model describing the response body
+            **kwargs: Additional arguments for get (params, timeout)
+
+        Returns:
+            Validated model instance
+        """
+        response = self.get(path, **kwargs)
+        return model.model_validate_json(response.content)
 
     def post(
         self,
         path: str,
-        params: Optional[Dict[str, Any]] = None,
-        json: Optional[Dict[str, Any]] = None,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
         timeout: int = 30,
-    ) -> requests.Response:
+    ) -> httpx.Response:
         """Make a POST request.
         
         Args:
@@ -99,10 +309,10 @@ class HttpClient:
     def patch(
         self,
         path: str,
-        params: Optional[Dict[str, Any]] = None,
-        json: Optional[Dict[str, Any]] = None,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
         timeout: int = 30,
-    ) -> requests.Response:
+    ) -> httpx.Response:
         """Make a PATCH request.
         
         Args:
@@ -117,8 +327,11 @@ class HttpClient:
         return self._request("PATCH", path, params=params, json=json, timeout=timeout)
 
     def options(
-        self, path: str, params: Optional[Dict[str, Any]] = None, timeout: int = 30
-    ) -> requests.Response:
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        timeout: int = 30,
+    ) -> httpx.Response:
         """Make an OPTIONS request.
         
         Args:
@@ -132,8 +345,11 @@ class HttpClient:
         return self._request("OPTIONS", path, params=params, timeout=timeout)
 
     def delete(
-        self, path: str, params: Optional[Dict[str, Any]] = None, timeout: int = 30
-    ) -> requests.Response:
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        timeout: int = 30,
+    ) -> httpx.Response:
         """Make a DELETE request.
         
         Args:
@@ -147,10 +363,155 @@ class HttpClient:
         return self._request("DELETE", path, params=params, timeout=timeout)
 
 
+class AsyncHttpClient:
+    """Asynchronous counterpart to HttpClient.
+
+    Lets callers issue concurrent requests with asyncio.gather, multiplexed over
+    a single HTTP/2 connection per host.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        headers: dict[str, str] | None = None,
+        http2: bool = True,
+        max_connections: int = 10,
+        keepalive_expiry: float = KEEPALIVE_EXPIRY,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+    ) -> None:
+        """Initialize the async HTTP client with a base URL and optional headers.
+
+        Args:
+            base_url: The base URL for all requests
+            headers: Optional headers to include with all requests
+            http2: Negotiate HTTP/2 so concurrent requests share one connection
+            max_connections: Maximum number of pooled connections to the host
+            keepalive_expiry: Seconds an idle connection is kept open for reuse
+            max_retries: Number of times to retry a request that fails to connect
+                or is throttled (429, 502, 503, 504)
+            backoff_factor: Base delay in seconds between throttled retries when
+                the server sends no Retry-After header
+        """
+        self.base_url = base_url
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.headers = httpx.Headers({"User-Agent": DEFAULT_USER_AGENT, **(headers or {})})
+        transport = httpx.AsyncHTTPTransport(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            retries=max_retries,
+        )
+        self.session = httpx.AsyncClient(transport=transport)
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self.session.aclose()
+
+    async def __aenter__(self) -> "AsyncHttpClient":
+        """Enter a context that closes the client on exit."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the client when leaving the context."""
+        await self.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        timeout: int = 30,
+    ) -> httpx.Response:
+        """Make an HTTP request.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: URL path to append to base_url
+            params: Optional query parameters
+            json: Optional JSON body
+            timeout: Request timeout in seconds
+
+        Returns:
+            Response object
+
+        Raises:
+            httpx.HTTPStatusError: For 4xx and 5xx responses, once retries of
+                throttled requests are exhausted
+        """
+        url = f"{self.base_url}{path}"
+        attempt = 0
+        while True:
+            response = await self.session.request(
+                method,
+                url,
+                headers=self.headers,
+                params=params,
+                json=json,
+                timeout=timeout,
+            )
+
+            if response.status_code in RETRY_STATUSES and attempt < self.max_retries:
+                await asyncio.sleep(retry_delay(response, attempt, self.backoff_factor))
+                attempt += 1
+                continue
+
+            response.raise_for_status()
+            return response
+
+    async def get(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        timeout: int = 30,
+    ) -> httpx.Response:
+        """Make a GET request.
+
+        Args:
+            path: URL path to append to base_url
+            params: Optional query parameters
+            timeout: Request timeout in seconds
+
+        Returns:
+            Response object
+        """
+        return await self._request("GET", path, params=params, timeout=timeout)
+
+    async def post(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        timeout: int = 30,
+    ) -> httpx.Response:
+        """Make a POST request.
+
+        Args:
+            path: URL path to append to base_url
+            params: Optional query parameters
+            json: Optional JSON body
+            timeout: Request timeout in seconds
+
+        Returns:
+            Response object
+        """
+        return await self._request("POST", path, params=params, json=json, timeout=timeout)
+
+
 class HeaderAdder:
     """Utility class for adding headers to an HTTP client."""
 
-    def __init__(self, client: HttpClient, headers: Dict[str, str]) -> None:
+    def __init__(self, client: HttpClient | AsyncHttpClient, headers: dict[str, str]) -> None:
         """Initialize the HeaderAdder with a client and headers.
         
         Args:
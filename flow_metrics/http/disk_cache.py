@@ -0,0 +1,88 @@
+"""Persistent response caching for HTTP clients."""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any
+
+
+class DiskCache:
+    """SQLite-backed cache of response bodies that survives between runs.
+
+    Entries are keyed by URL and query parameters and expire after a fixed
+    time to live, so reruns of a collection script can skip requests whose
+    answers are recent enough.
+    """
+
+    def __init__(self, path: str, ttl: float) -> None:
+        """Initialize the cache, creating the database file if needed.
+
+        Args:
+            path: Path of the SQLite database file
+            ttl: Time in seconds before an entry expires
+        """
+        self.path = path
+        self.ttl = ttl
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # One connection shared by all threads, serialized by the lock
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, body BLOB NOT NULL, stored_at REAL NOT NULL)",
+            )
+
+    @staticmethod
+    def key(url: str, params: dict[str, Any] | None = None) -> str:
+        """Build the cache key for a request.
+
+        Args:
+            url: Full URL of the request
+            params: Query parameters of the request
+
+        Returns:
+            Key independent of query parameter order
+        """
+        query = sorted((name, str(value)) for name, value in (params or {}).items())
+        return json.dumps([url, query])
+
+    def get(self, key: str) -> bytes | None:
+        """Get a cached body if it has not expired.
+
+        Args:
+            key: Cache key from DiskCache.key
+
+        Returns:
+            Response body or None
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body FROM responses WHERE key = ? AND stored_at > ?",
+                (key, time.time() - self.ttl),
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, body: bytes) -> None:
+        """Store a response body.
+
+        Args:
+            key: Cache key from DiskCache.key
+            body: Response body
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, body, stored_at) VALUES (?, ?, ?)",
+                (key, body, time.time()),
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,46 @@
+"""Rate limiting for HTTP clients."""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Thread-safe token bucket limiting how often requests may be sent.
+
+    Tokens refill continuously at `rate` per second up to `burst`. Each call to
+    acquire takes one token, sleeping until it is available, so concurrent
+    callers are spaced out rather than rejected.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            rate: Sustained requests allowed per second
+            burst: Requests that may be sent back to back after an idle period
+
+        Raises:
+            ValueError: If rate or burst is not positive
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate and burst must be positive")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take a token, blocking until one is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve the token even if it has not refilled yet; a negative balance
+            # is the time this caller (and any after it) has to wait
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
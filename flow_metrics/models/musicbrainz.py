@@ -2,7 +2,7 @@
 
 from typing import Any, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 # Generic type for items in paginated responses
 T = TypeVar("T")
@@ -30,6 +30,8 @@ class MusicBrainzLifeSpan(BaseModel):
     end: str | None = None
     ended: bool | None = None
 
+    model_config = ConfigDict(frozen=True)
+
 
 class MusicBrainzAlias(BaseModel):
     """Alias for an entity in MusicBrainz."""
@@ -42,8 +44,76 @@ class MusicBrainzAlias(BaseModel):
     end_date: str | None = Field(None, alias="end-date")
     locale: str | None = None
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+
+
+class MusicBrainzArtistRef(BaseModel):
+    """Artist referenced from another MusicBrainz entity."""
+
+    id: str
+    name: str
+    sort_name: str | None = Field(None, alias="sort-name")
+    disambiguation: str | None = None
+    type: str | None = None
+    country: str | None = None
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class MusicBrainzWorkRef(BaseModel):
+    """Work referenced from another MusicBrainz entity."""
+
+    id: str
+    title: str
+    type: str | None = None
+    disambiguation: str | None = None
+    language: str | None = None
+
+
+class MusicBrainzRecordingRef(BaseModel):
+    """Recording referenced from another MusicBrainz entity."""
+
+    id: str
+    title: str
+    length: int | None = None
+    video: bool | None = None
+    disambiguation: str | None = None
+
+
+class MusicBrainzReleaseRef(BaseModel):
+    """Release referenced from another MusicBrainz entity."""
+
+    id: str
+    title: str
+    status: str | None = None
+    date: str | None = None
+    country: str | None = None
+    disambiguation: str | None = None
+
+
+class MusicBrainzReleaseGroupRef(BaseModel):
+    """Release group referenced from another MusicBrainz entity."""
+
+    id: str
+    title: str
+    primary_type: str | None = Field(None, alias="primary-type")
+    secondary_types: list[str] | None = Field(None, alias="secondary-types")
+    first_release_date: str | None = Field(None, alias="first-release-date")
+    disambiguation: str | None = None
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class MusicBrainzLabel(BaseModel):
+    """Record label referenced from a release."""
+
+    id: str
+    name: str
+    sort_name: str | None = Field(None, alias="sort-name")
+    disambiguation: str | None = None
+    label_code: int | None = Field(None, alias="label-code")
+
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class MusicBrainzRelation(BaseModel):
@@ -63,14 +133,13 @@ class MusicBrainzRelation(BaseModel):
     # The target entity can be of various types
     # We'll handle this during parsing
     target_credit: str | None = Field(None, alias="target-credit")
-    artist: dict[str, Any] | None = None
-    work: dict[str, Any] | None = None
-    recording: dict[str, Any] | None = None
-    release: dict[str, Any] | None = None
-    release_group: dict[str, Any] | None = Field(None, alias="release-group")
+    artist: MusicBrainzArtistRef | None = None
+    work: MusicBrainzWorkRef | None = None
+    recording: MusicBrainzRecordingRef | None = None
+    release: MusicBrainzReleaseRef | None = None
+    release_group: MusicBrainzReleaseGroupRef | None = Field(None, alias="release-group")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class MusicBrainzArea(BaseModel):
@@ -82,15 +151,14 @@ class MusicBrainzArea(BaseModel):
     disambiguation: str | None = None
     iso_3166_1_codes: list[str] | None = Field(None, alias="iso-3166-1-codes")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
 
 
 class MusicBrainzArtistCredit(BaseModel):
     """Artist credit in MusicBrainz."""
 
     name: str
-    artist: dict[str, Any]
+    artist: MusicBrainzArtistRef
     joinphrase: str | None = None
 
 
@@ -100,6 +168,8 @@ class MusicBrainzTag(BaseModel):
     count: int
     name: str
 
+    model_config = ConfigDict(frozen=True)
+
 
 class MusicBrainzArtist(BaseModel):
     """MusicBrainz artist entity."""
@@ -122,8 +192,7 @@ class MusicBrainzArtist(BaseModel):
     relations: list[MusicBrainzRelation] | None = Field(None, alias="relation-list")
     tags: list[MusicBrainzTag] | None = Field(None, alias="tag-list")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class MusicBrainzArtistList(BaseModel):
@@ -133,8 +202,7 @@ class MusicBrainzArtistList(BaseModel):
     offset: int
     artists: list[MusicBrainzArtist] = Field(alias="artist-list")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class MusicBrainzReleaseGroup(BaseModel):
@@ -150,12 +218,11 @@ class MusicBrainzReleaseGroup(BaseModel):
     disambiguation: str | None = None
     score: int | None = Field(None, alias="ext:score")
     artist_credit: list[MusicBrainzArtistCredit] | None = Field(None, alias="artist-credit")
-    releases: list[dict[str, Any]] | None = Field(None, alias="release-list")
+    releases: list[MusicBrainzReleaseRef] | None = Field(None, alias="release-list")
     tags: list[MusicBrainzTag] | None = Field(None, alias="tag-list")
     relations: list[MusicBrainzRelation] | None = Field(None, alias="relation-list")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class MusicBrainzReleaseGroupList(BaseModel):
@@ -168,9 +235,7 @@ class MusicBrainzReleaseGroupList(BaseModel):
         default_factory=list,
     )
 
-    class Config:
-        populate_by_name = True
-        from_attributes = True
+    model_config = ConfigDict(populate_by_name=True, from_attributes=True)
 
 
 class MusicBrainzTrack(BaseModel):
@@ -181,11 +246,10 @@ class MusicBrainzTrack(BaseModel):
     number: str
     title: str
     length: int | None = None
-    recording: dict[str, Any] | None = None
+    recording: MusicBrainzRecordingRef | None = None
     artist_credit: list[MusicBrainzArtistCredit] | None = Field(None, alias="artist-credit")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class MusicBrainzMedium(BaseModel):
@@ -196,8 +260,7 @@ class MusicBrainzMedium(BaseModel):
     track_count: int = Field(alias="track-count")
     tracks: list[MusicBrainzTrack] | None = Field(None, alias="track-list")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class MusicBrainzCoverArtArchive(BaseModel):
@@ -214,10 +277,9 @@ class MusicBrainzLabelInfo(BaseModel):
     """Label information for a release."""
 
     catalog_number: str | None = Field(None, alias="catalog-number")
-    label: dict[str, Any] | None = None
+    label: MusicBrainzLabel | None = None
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class MusicBrainzRelease(BaseModel):
@@ -234,15 +296,14 @@ class MusicBrainzRelease(BaseModel):
     barcode: str | None = None
     score: int | None = Field(None, alias="ext:score")
     artist_credit: list[MusicBrainzArtistCredit] | None = Field(None, alias="artist-credit")
-    release_group: dict[str, Any] | None = Field(None, alias="release-group")
+    release_group: MusicBrainzReleaseGroupRef | None = Field(None, alias="release-group")
     media: list[MusicBrainzMedium] | None = Field(None, alias="medium-list")
     label_info: list[MusicBrainzLabelInfo] | None = Field(None, alias="label-info-list")
     cover_art_archive: MusicBrainzCoverArtArchive | None = Field(None, alias="cover-art-archive")
     tags: list[MusicBrainzTag] | None = Field(None, alias="tag-list")
     relations: list[MusicBrainzRelation] | None = Field(None, alias="relation-list")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class MusicBrainzReleaseList(BaseModel):
@@ -252,8 +313,7 @@ class MusicBrainzReleaseList(BaseModel):
     offset: int
     releases: list[MusicBrainzRelease] = Field(alias="release-list")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class MusicBrainzRecording(BaseModel):
@@ -266,13 +326,12 @@ class MusicBrainzRecording(BaseModel):
     disambiguation: str | None = None
     score: int | None = Field(None, alias="ext:score")
     artist_credit: list[MusicBrainzArtistCredit] | None = Field(None, alias="artist-credit")
-    releases: list[dict[str, Any]] | None = Field(None, alias="release-list")
+    releases: list[MusicBrainzReleaseRef] | None = Field(None, alias="release-list")
     isrcs: list[str] | None = Field(None, alias="isrc-list")
     tags: list[MusicBrainzTag] | None = Field(None, alias="tag-list")
     relations: list[MusicBrainzRelation] | None = Field(None, alias="relation-list")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class MusicBrainzRecordingList(BaseModel):
@@ -282,8 +341,7 @@ class MusicBrainzRecordingList(BaseModel):
     offset: int
     recordings: list[MusicBrainzRecording] = Field(alias="recording-list")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class MusicBrainzWork(BaseModel):
@@ -300,8 +358,7 @@ class MusicBrainzWork(BaseModel):
     relations: list[MusicBrainzRelation] | None = Field(None, alias="relation-list")
     tags: list[MusicBrainzTag] | None = Field(None, alias="tag-list")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class MusicBrainzWorkList(BaseModel):
@@ -311,8 +368,7 @@ class MusicBrainzWorkList(BaseModel):
     offset: int
     works: list[MusicBrainzWork] = Field(alias="work-list")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class CoverArtImage(BaseModel):
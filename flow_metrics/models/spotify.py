@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Any, Generic, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 # Generic type for items in paginated responses
 T = TypeVar("T")
@@ -41,6 +41,8 @@ class SpotifyImage(BaseModel):
     height: int | None = None
     width: int | None = None
 
+    model_config = ConfigDict(frozen=True)
+
 
 class SpotifyFollowers(BaseModel):
     """Spotify followers object."""
@@ -48,14 +50,15 @@ class SpotifyFollowers(BaseModel):
     href: str | None = None
     total: int
 
+    model_config = ConfigDict(frozen=True)
+
 
 class SpotifyExternalUrls(BaseModel):
     """External URLs for Spotify objects."""
 
     spotify: str = Field(alias="spotify", default="")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
 
 
 class SpotifyExternalIds(BaseModel):
@@ -65,6 +68,15 @@ class SpotifyExternalIds(BaseModel):
     ean: str | None = None
     upc: str | None = None
 
+    model_config = ConfigDict(frozen=True)
+
+
+class SpotifyCopyright(BaseModel):
+    """Copyright statement for a Spotify album."""
+
+    text: str
+    type: str  # C = copyright, P = sound recording copyright
+
 
 class SpotifyArtistSimplified(BaseModel):
     """Simplified Spotify artist object."""
@@ -92,6 +104,7 @@ class SpotifyAlbumSimplified(BaseModel):
     id: str
     name: str
     album_type: str  # album, single, compilation
+    album_group: str | None = None  # album, single, compilation, appears_on (artist albums only)
     release_date: str
     release_date_precision: str  # year, month, day
     total_tracks: int
@@ -109,7 +122,7 @@ class SpotifyAlbum(SpotifyAlbumSimplified):
     genres: list[str] = Field(default_factory=list)
     label: str | None = None
     popularity: int | None = None
-    copyrights: list[dict[str, str]] = Field(default_factory=list)
+    copyrights: list[SpotifyCopyright] = Field(default_factory=list)
     external_ids: SpotifyExternalIds | None = None
 
 
@@ -143,7 +156,7 @@ class PaginatedResponse(BaseModel, Generic[T]):
     """Base class for paginated responses from Spotify API."""
 
     href: str
-    items: list[T]
+    items: list[T] = Field(repr=False)
     limit: int
     next: str | None = None
     offset: int
@@ -2,14 +2,21 @@
 """Script for collecting hip-hop artist data and storing in MongoDB."""
 
 import argparse
+import asyncio
 import os
+import re
 import sys
 import time
+from collections.abc import Awaitable, Callable
+from functools import singledispatch
 from typing import Any
 
 from dotenv import load_dotenv
+from pydantic import BaseModel
 from rich.console import Console
+from rich.live import Live
 from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.table import Table
 
 # Add the project root to the path if running as script
 if __name__ == "__main__" and __package__ is None:
@@ -21,7 +28,84 @@ from flow_metrics.clients.musicbrainz import MusicBrainzClient, MusicBrainzError
 from flow_metrics.clients.spotify import SpotifyClient, SpotifyError
 from flow_metrics.config.settings import get_settings
 from flow_metrics.db.mongodb import MongoDBClient
-from flow_metrics.models.spotify import SpotifyArtist
+from flow_metrics.models.spotify import SpotifyAlbumSimplified, SpotifyArtist
+from flow_metrics.utils.helpers import MAX_STORED_APPEARANCES, summarize_album
+
+# Number of artists written to MongoDB per bulk write
+UPSERT_BATCH_SIZE = 50
+
+# Number of artists whose data is fetched at the same time; the clients'
+# rate limiters still pace the requests themselves
+ARTIST_CONCURRENCY = 4
+
+# Genre search terms used to find hip-hop artists
+SEARCH_TERMS = (
+    "hip hop",
+    "rap",
+    "trap",
+    "drill",
+    "conscious rap",
+    "gangsta rap",
+    "boom bap",
+    "horrorcore",
+)
+
+# Notable hip-hop artists to ensure are included
+NOTABLE_ARTISTS = (
+    "Kendrick Lamar",
+    "Jay-Z",
+    "Kanye West",
+    "Drake",
+    "Nas",
+    "Tupac Shakur",
+    "The Notorious B.I.G.",
+    "Eminem",
+    "Run-DMC",
+    "Wu-Tang Clan",
+    "A Tribe Called Quest",
+)
+
+# Stored artist fields and the Spotify album group fetched for each
+ALBUM_GROUPS = (
+    ("albums", "album"),
+    ("singles", "single"),
+    ("compilations", "compilation"),
+    ("appears_on", "appears_on"),
+)
+
+# Matches genres that mark a search result as a hip-hop artist
+HIP_HOP_GENRE_RE = re.compile(r"hip hop|rap|trap|drill")
+
+
+@singledispatch
+def to_dict(obj: Any) -> Any:
+    """Convert Pydantic models nested in a value to dictionaries for MongoDB storage.
+
+    The conversion is chosen by a single type lookup per value; values of any
+    other type are returned unchanged.
+
+    Args:
+        obj: Value to convert
+
+    Returns:
+        Value that pymongo can encode
+    """
+    return obj
+
+
+@to_dict.register
+def _(obj: BaseModel) -> dict[str, Any]:
+    return obj.model_dump()
+
+
+@to_dict.register
+def _(obj: dict) -> dict[str, Any]:
+    return {key: to_dict(value) for key, value in obj.items()}
+
+
+@to_dict.register
+def _(obj: list) -> list[Any]:
+    return [to_dict(item) for item in obj]
 
 
 def setup_argparse() -> argparse.ArgumentParser:
@@ -62,109 +146,97 @@ def setup_argparse() -> argparse.ArgumentParser:
     return parser
 
 
-def search_hip_hop_artists(
+async def search_hip_hop_artists(
     spotify_client: SpotifyClient,
     limit: int = 50,
-    console: Console = Console(),
+    console: Console | None = None,
 ) -> list[SpotifyArtist]:
     """Search for hip-hop artists using Spotify search.
 
+    The notable artist lookups are independent, so they are run concurrently
+    in worker threads, paced by the client's rate limiter.
+
     Args:
         spotify_client: Spotify client
         limit: Maximum number of artists to return
-        console: Rich console for output
+        console: Rich console for output; a new one is created if omitted
 
     Returns:
         List of hip-hop artists
     """
-    # List of search terms to find hip-hop artists
-    search_terms = [
-        "hip hop",
-        "rap",
-        "trap",
-        "drill",
-        "conscious rap",
-        "gangsta rap",
-        "boom bap",
-        "horrorcore",
-    ]
-
-    # List of notable hip-hop artists to ensure are included
-    notable_artists = [
-        "Kendrick Lamar",
-        "Jay-Z",
-        "Kanye West",
-        "Drake",
-        "Nas",
-        "Tupac Shakur",
-        "The Notorious B.I.G.",
-        "Eminem",
-        "Run-DMC",
-        "Wu-Tang Clan",
-        "A Tribe Called Quest",
-    ]
+    console = console or Console()
 
     artists = []
-    artists_seen = set()
-
-    # First add notable artists
-    for artist_name in notable_artists:
-        if len(artists) >= limit:
-            break
+    artists_seen: set[str] = set()
+
+    # Found artists are added as table rows and rendered by one live display
+    # rather than printed line by line
+    table = Table(title="Hip-hop artists found")
+    table.add_column("Artist", style="cyan")
+    table.add_column("Source", style="magenta")
+
+    with Live(table, console=console, refresh_per_second=4) as live:
+        # First add notable artists, authenticating up front so the concurrent
+        # searches share one token
+        spotify_client.authenticate()
+        notable_names = NOTABLE_ARTISTS[:limit]
+        notable_results = await asyncio.gather(
+            *(
+                asyncio.to_thread(spotify_client.search_artists, artist_name, limit=1)
+                for artist_name in notable_names
+            ),
+            return_exceptions=True,
+        )
 
-        try:
-            results = spotify_client.search_artists(artist_name, limit=1)
-            if results and results[0].id not in artists_seen:
+        for artist_name, results in zip(notable_names, notable_results, strict=True):
+            if isinstance(results, SpotifyError):
+                live.console.print(
+                    f"[yellow]Warning:[/yellow] Could not find notable artist '{artist_name}': "
+                    f"{results}",
+                )
+            elif isinstance(results, BaseException):
+                raise results
+            elif results and results[0].id not in artists_seen:
                 artists.append(results[0])
                 artists_seen.add(results[0].id)
-                console.print(f"Added notable artist: {results[0].name}")
-        except SpotifyError as e:
-            console.print(
-                f"[yellow]Warning:[/yellow] Could not find notable artist '{artist_name}': {e}",
-            )
+                table.add_row(results[0].name, "notable")
 
-        # Add a small delay to avoid rate limiting
-        time.sleep(0.5)
-
-    # Then search for additional artists by genre
-    for term in search_terms:
-        if len(artists) >= limit:
-            break
-
-        # Search for artists with the genre term
-        try:
-            console.print(f"Searching for artists with term: {term}")
-            results = spotify_client.search_artists(
-                f"genre:{term}",
-                limit=min(20, limit - len(artists)),
-            )
+        # Then search for additional artists by genre
+        for term in SEARCH_TERMS:
+            if len(artists) >= limit:
+                break
 
-            for artist in results:
-                # Check if we already have this artist
-                if artist.id not in artists_seen and (
-                    # Check if artist has hip-hop related genres
-                    any(
-                        genre in " ".join(artist.genres).lower()
-                        for genre in ["hip hop", "rap", "trap", "drill"]
-                    )
-                ):
-                    artists.append(artist)
-                    artists_seen.add(artist.id)
-                    console.print(f"Added artist from search: {artist.name}")
+            # Search for artists with the genre term
+            try:
+                table.caption = f"Searching for artists with term: {term}"
+                results = spotify_client.search_artists(
+                    f"genre:{term}",
+                    limit=min(20, limit - len(artists)),
+                )
 
-                    if len(artists) >= limit:
-                        break
-        except SpotifyError as e:
-            console.print(f"[yellow]Warning:[/yellow] Error searching for term '{term}': {e}")
+                for artist in results:
+                    # Skip artists we already have or without hip-hop related genres
+                    if artist.id not in artists_seen and any(
+                        HIP_HOP_GENRE_RE.search(genre.lower()) for genre in artist.genres
+                    ):
+                        artists.append(artist)
+                        artists_seen.add(artist.id)
+                        table.add_row(artist.name, f"search: {term}")
+
+                        if len(artists) >= limit:
+                            break
+            except SpotifyError as e:
+                live.console.print(
+                    f"[yellow]Warning:[/yellow] Error searching for term '{term}': {e}",
+                )
 
-        # Add a small delay to avoid rate limiting
-        time.sleep(1)
+        table.caption = None
 
     console.print(f"[green]Found {len(artists)} hip-hop artists in total[/green]")
     return artists
 
 
-def get_artist_full_data(
+async def get_artist_full_data(
     spotify_client: SpotifyClient,
     mb_client: MusicBrainzClient,
     artist: SpotifyArtist,
@@ -172,6 +244,9 @@ def get_artist_full_data(
 ) -> dict[str, Any]:
     """Get comprehensive artist data from both Spotify and MusicBrainz.
 
+    The album lookups and the MusicBrainz search are independent, so they are
+    run concurrently in worker threads rather than one after another.
+
     Args:
         spotify_client: Spotify client
         mb_client: MusicBrainz client
@@ -186,7 +261,7 @@ def get_artist_full_data(
         "name": artist.name,
         "genres": artist.genres,
         "spotify_popularity": artist.popularity,
-        "spotify_followers": getattr(artist.followers, "total", 0) if artist.followers else 0,
+        "spotify_followers": artist.followers.total if artist.followers else 0,
         "spotify_images": [img.url for img in artist.images] if artist.images else [],
         "spotify_uri": artist.uri,
         "external_urls": artist.external_urls,
@@ -199,198 +274,136 @@ def get_artist_full_data(
         "last_updated": time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime()),
     }
 
-    # Get Spotify artist stats
-    try:
-        # Get separate album lists by type
-        albums = spotify_client.get_all_artist_albums(
-            artist_id=artist.id,
-            album_types=["album"],
-        )
-        
-        singles = spotify_client.get_all_artist_albums(
-            artist_id=artist.id,
-            album_types=["single"],
-        )
-        
-        compilations = spotify_client.get_all_artist_albums(
-            artist_id=artist.id,
-            album_types=["compilation"],
-        )
-        
-        # Only get a limited number of appearances to keep the data manageable
-        appearances = spotify_client.get_all_artist_albums(
-            artist_id=artist.id,
-            album_types=["appears_on"],
-        )
-        # Limit appearances to 100 to keep document size reasonable
-        appearances = appearances[:100] if len(appearances) > 100 else appearances
-        
-        # Count only albums where the artist is the primary artist (first artist)
+    # Authenticate up front so the concurrent lookups share one token
+    # instead of racing to request their own
+    spotify_client.authenticate()
+
+    *album_results, mb_results = await asyncio.gather(
+        *(
+            asyncio.to_thread(
+                spotify_client.get_all_artist_albums,
+                artist_id=artist.id,
+                album_types=[album_type],
+            )
+            for _, album_type in ALBUM_GROUPS
+        ),
+        asyncio.to_thread(mb_client.search_artists, artist.name),
+        return_exceptions=True,
+    )
+
+    # Only API errors are reported as warnings; anything else is a bug
+    for result in [*album_results, mb_results]:
+        if isinstance(result, BaseException) and not isinstance(
+            result,
+            SpotifyError | MusicBrainzError,
+        ):
+            raise result
+
+    # Each group is kept or reported on its own, so one failed listing does not
+    # discard the others
+    releases: dict[str, list[SpotifyAlbumSimplified]] = {}
+    for (field, _), result in zip(ALBUM_GROUPS, album_results, strict=True):
+        if isinstance(result, SpotifyError):
+            console.print(
+                f"[yellow]Warning:[/yellow] Could not get Spotify {field} for {artist.name}: "
+                f"{result}",
+            )
+        else:
+            releases[field] = result
+
+    # Limit appearances to keep document size reasonable
+    if "appears_on" in releases:
+        releases["appears_on"] = releases["appears_on"][:MAX_STORED_APPEARANCES]
+
+    # Process album lists into simplified format for storage
+    for field, group in releases.items():
+        artist_data[field] = [summarize_album(release) for release in group]
+
+    # Counts are only accurate when every group was fetched
+    if len(releases) == len(ALBUM_GROUPS):
+        # Count only albums and singles where the artist is the primary (first) artist
         primary_albums = [
-            album for album in albums 
+            album
+            for album in releases["albums"]
             if album.artists and album.artists[0].id == artist.id
         ]
-        
-        # Count only singles where the artist is the primary artist
         primary_singles = [
-            single for single in singles 
+            single
+            for single in releases["singles"]
             if single.artists and single.artists[0].id == artist.id
         ]
-        
+        compilation_count = len(releases["compilations"])
+
         # Calculate accurate album counts
         artist_data["album_counts"] = {
             "album": len(primary_albums),
             "single": len(primary_singles),
-            "compilation": len(compilations),
-            "appears_on": len(appearances),
-            "total": len(primary_albums) + len(primary_singles) + len(compilations),
+            "compilation": compilation_count,
+            "appears_on": len(releases["appears_on"]),
+            "total": len(primary_albums) + len(primary_singles) + compilation_count,
         }
-        
-        # Process album lists into simplified format for storage
-        artist_data["albums"] = [
-            {
-                "id": album.id,
-                "name": album.name,
-                "release_date": album.release_date,
-                "total_tracks": album.total_tracks,
-                "album_type": album.album_type,
-                "primary_artist": album.artists[0].name if album.artists else None,
-                "is_primary_artist": album.artists[0].id == artist.id if album.artists else False,
-                "image": album.images[0].url if album.images and len(album.images) > 0 else None,
-            }
-            for album in albums
-        ]
-    except SpotifyError as e:
-        console.print(
-            f"[yellow]Warning:[/yellow] Could not get Spotify stats for {artist.name}: {e}",
-        )
 
-    # Get all artist albums
+    # Try to find MusicBrainz data
     try:
-        # Get albums
-        albums = spotify_client.get_all_artist_albums(
-            artist_id=artist.id,
-            album_types=["album"],
-        )
-
-        artist_data["albums"] = [
-            {
-                "id": album.id,
-                "name": album.name,
-                "release_date": album.release_date,
-                "total_tracks": album.total_tracks,
-                "album_type": album.album_type,
-                "image": album.images[0].url if album.images and len(album.images) > 0 else None,
+        if isinstance(mb_results, MusicBrainzError):
+            raise mb_results
+
+        # Find the best match using the score provided by MusicBrainz
+        best_match = max(mb_results.artists, key=lambda a: a.score or 0, default=None)
+
+        if best_match and (best_match.score or 0) > 70:  # Only use if confidence is high
+            # Get MusicBrainz artist info
+            mb_info = await asyncio.to_thread(mb_client.get_artist_info, best_match.id)
+
+            artist_data["musicbrainz_info"] = {
+                "id": best_match.id,
+                "name": best_match.name,
+                "disambiguation": best_match.disambiguation,
+                "country": best_match.country,
+                "type": best_match.type,
+                "life_span": {
+                    "begin": best_match.life_span.begin if best_match.life_span else None,
+                    "end": best_match.life_span.end if best_match.life_span else None,
+                    "ended": best_match.life_span.ended if best_match.life_span else None,
+                },
+                "release_counts": mb_info["release_group_counts"]
+                if "release_group_counts" in mb_info
+                else {},
             }
-            for album in albums
-        ]
-
-        # Get singles
-        singles = spotify_client.get_all_artist_albums(
-            artist_id=artist.id,
-            album_types=["single"],
+    except MusicBrainzError as e:
+        console.print(
+            f"[yellow]Warning:[/yellow] Could not get MusicBrainz data for {artist.name}: {e}",
         )
 
-        artist_data["singles"] = [
-            {
-                "id": single.id,
-                "name": single.name,
-                "release_date": single.release_date,
-                "total_tracks": single.total_tracks,
-                "album_type": single.album_type,
-                "image": single.images[0].url if single.images and len(single.images) > 0 else None,
-            }
-            for single in singles
-        ]
-
-        # Get compilations
-        compilations = spotify_client.get_all_artist_albums(
-            artist_id=artist.id,
-            album_types=["compilation"],
-        )
+    return artist_data
 
-        artist_data["compilations"] = [
-            {
-                "id": compilation.id,
-                "name": compilation.name,
-                "release_date": compilation.release_date,
-                "total_tracks": compilation.total_tracks,
-                "album_type": compilation.album_type,
-                "image": compilation.images[0].url
-                if compilation.images and len(compilation.images) > 0
-                else None,
-            }
-            for compilation in compilations
-        ]
 
-        # Get appearances
-        appearances = spotify_client.get_all_artist_albums(
-            artist_id=artist.id,
-            album_types=["appears_on"],
-        )
+async def collect_artist_data(
+    spotify_client: SpotifyClient,
+    mb_client: MusicBrainzClient,
+    artists: list[SpotifyArtist],
+    console: Console,
+    on_artist: Callable[[dict[str, Any]], Awaitable[None]],
+    concurrency: int = ARTIST_CONCURRENCY,
+) -> None:
+    """Fetch data for several artists concurrently.
 
-        # Limit appearances to 100 to keep document size reasonable
-        appearances = appearances[:100] if len(appearances) > 100 else appearances
-
-        artist_data["appears_on"] = [
-            {
-                "id": appearance.id,
-                "name": appearance.name,
-                "release_date": appearance.release_date,
-                "total_tracks": appearance.total_tracks,
-                "album_type": appearance.album_type,
-                "image": appearance.images[0].url
-                if appearance.images and len(appearance.images) > 0
-                else None,
-            }
-            for appearance in appearances
-        ]
-    except SpotifyError as e:
-        console.print(
-            f"[yellow]Warning:[/yellow] Could not get Spotify albums for {artist.name}: {e}",
-        )
+    Args:
+        spotify_client: Spotify client
+        mb_client: MusicBrainz client
+        artists: Spotify artist objects
+        console: Rich console for output
+        on_artist: Called with each artist's MongoDB-compatible data as it completes
+        concurrency: Maximum number of artists fetched at the same time
+    """
+    semaphore = asyncio.Semaphore(concurrency)
 
-    # Try to find MusicBrainz data
-    try:
-        mb_results = mb_client.search_artists(artist.name)
-
-        if mb_results.artists:
-            # Find the best match
-            best_match = None
-            highest_score = 0
-
-            for mb_artist in mb_results.artists:
-                # Use the score provided by MusicBrainz
-                score = getattr(mb_artist, "score", 0)
-                if score > highest_score:
-                    highest_score = score
-                    best_match = mb_artist
-
-            if best_match and highest_score > 70:  # Only use if confidence is high
-                # Get MusicBrainz artist info
-                mb_info = mb_client.get_artist_info(best_match.id)
-
-                artist_data["musicbrainz_info"] = {
-                    "id": best_match.id,
-                    "name": best_match.name,
-                    "disambiguation": best_match.disambiguation,
-                    "country": best_match.country,
-                    "type": best_match.type,
-                    "life_span": {
-                        "begin": best_match.life_span.begin if best_match.life_span else None,
-                        "end": best_match.life_span.end if best_match.life_span else None,
-                        "ended": best_match.life_span.ended if best_match.life_span else None,
-                    },
-                    "release_counts": mb_info["release_group_counts"]
-                    if "release_group_counts" in mb_info
-                    else {},
-                }
-    except MusicBrainzError as e:
-        console.print(
-            f"[yellow]Warning:[/yellow] Could not get MusicBrainz data for {artist.name}: {e}",
-        )
+    async def process(artist: SpotifyArtist) -> None:
+        async with semaphore:
+            artist_data = await get_artist_full_data(spotify_client, mb_client, artist, console)
+        await on_artist(to_dict(artist_data))
 
-    return artist_data
+    await asyncio.gather(*(process(artist) for artist in artists))
 
 
 def main() -> None:
@@ -409,27 +422,13 @@ def main() -> None:
         # Connect to MongoDB
         console.print("Connecting to MongoDB...")
         mongo_client = MongoDBClient(args.mongo_uri, args.db_name, args.collection)
+        mongo_client.ensure_indexes()
 
         # Create API clients
         console.print("Initializing API clients...")
         spotify_client = create_spotify_client()
         mb_client = create_musicbrainz_client()
 
-        # Add helper function to convert Pydantic models to dictionaries
-        def convert_model_to_dict(obj):
-            """Convert Pydantic models to dictionaries for MongoDB storage."""
-            if hasattr(obj, "model_dump"):
-                # For newer Pydantic v2.x
-                return obj.model_dump()
-            if hasattr(obj, "dict") and callable(obj.dict):
-                # For older Pydantic v1.x
-                return obj.dict()
-            if isinstance(obj, dict):
-                return {k: convert_model_to_dict(v) for k, v in obj.items()}
-            if isinstance(obj, list):
-                return [convert_model_to_dict(item) for item in obj]
-            return obj
-
         # Get current count of artists in database
         existing_count = mongo_client.count_artists()
         console.print(f"Found {existing_count} artists already in the database")
@@ -437,20 +436,13 @@ def main() -> None:
         # Fetch more artists than we need so we have extras if some already exist
         search_limit = min(args.limit * 3, 150)  # Get up to 3x what we need, max 150
         console.print(f"Searching for up to {search_limit} hip-hop artists...")
-        all_artists = search_hip_hop_artists(spotify_client, search_limit, console)
+        all_artists = asyncio.run(search_hip_hop_artists(spotify_client, search_limit, console))
 
         console.print(f"[bold]Found {len(all_artists)} total hip-hop artists from search.[/bold]")
 
-        # Filter for artists not already in the database
-        new_artists = []
-        for artist in all_artists:
-            # Check if artist exists in database
-            if not mongo_client.find_artist_by_spotify_id(artist.id):
-                new_artists.append(artist)
-
-            # Stop once we've found enough new artists
-            if len(new_artists) >= args.limit:
-                break
+        # Filter for artists not already in the database, checking them all in one query
+        known_ids = mongo_client.find_existing_spotify_ids([artist.id for artist in all_artists])
+        new_artists = [artist for artist in all_artists if artist.id not in known_ids][: args.limit]
 
         console.print(f"[bold]Found {len(new_artists)} new artists to add to the database.[/bold]")
 
@@ -461,6 +453,20 @@ def main() -> None:
             )
             return
 
+        # Artists waiting to be written in the next bulk write
+        pending: list[dict[str, Any]] = []
+
+        async def flush_pending() -> None:
+            """Write the pending artists to MongoDB in one bulk write."""
+            # Take the batch first; other artists keep arriving during the write
+            batch = pending.copy()
+            pending.clear()
+            result = await asyncio.to_thread(mongo_client.bulk_upsert_artists, batch)
+            console.print(
+                f"Saved {len(batch)} artists "
+                f"({result['inserted_count']} new, {result['modified_count']} updated)",
+            )
+
         # Process each new artist
         with Progress(
             SpinnerColumn(),
@@ -469,28 +475,35 @@ def main() -> None:
         ) as progress:
             task = progress.add_task("Processing artists...", total=len(new_artists))
 
-            for i, artist in enumerate(new_artists):
+            async def store_artist(artist_data: dict[str, Any]) -> None:
+                """Queue an artist for storage, writing a full batch in one round trip."""
+                pending.append(artist_data)
+                if len(pending) >= UPSERT_BATCH_SIZE:
+                    await flush_pending()
+
+                # Update progress
                 progress.update(
                     task,
-                    description=f"Processing {artist.name} ({i + 1}/{len(new_artists)})",
+                    advance=1,
+                    description=f"Processed {artist_data['name']}",
                 )
 
-                # Get comprehensive artist data
-                artist_data = get_artist_full_data(spotify_client, mb_client, artist, console)
-
-                # Convert to MongoDB-compatible format
-                artist_data = convert_model_to_dict(artist_data)
-
-                # Store in MongoDB
-                result = mongo_client.upsert_artist(artist_data)
-
-                progress.console.print(f"Inserted new artist: {artist.name}")
-
-                # Update progress
-                progress.advance(task)
+            async def collect_and_store() -> None:
+                """Collect every new artist, then write whatever is left pending."""
+                try:
+                    await collect_artist_data(
+                        spotify_client,
+                        mb_client,
+                        new_artists,
+                        console,
+                        store_artist,
+                    )
+                finally:
+                    # Store what was collected, even if processing stopped early
+                    if pending:
+                        await flush_pending()
 
-                # Respect rate limits
-                time.sleep(1)
+            asyncio.run(collect_and_store())
 
         # Print summary
         total_count = mongo_client.count_artists()
@@ -3,11 +3,14 @@
 
 import argparse
 import os
+import re
 import sys
 from typing import Any
 
+from bson.regex import Regex
 from dotenv import load_dotenv
-from rich.console import Console
+from pymongo.cursor import Cursor
+from rich.console import Console, Group
 from rich.table import Table
 
 # Add the project root to the path if running as script
@@ -16,7 +19,16 @@ if __name__ == "__main__" and __package__ is None:
     __package__ = "flow_metrics.scripts"
 
 from flow_metrics.config.settings import get_settings
-from flow_metrics.db.mongodb import MongoDBClient
+from flow_metrics.db.mongodb import CASE_INSENSITIVE, MongoDBClient
+
+# Fields left out of the summary view; the release lists are the bulk of each document
+SUMMARY_PROJECTION: dict[str, Any] = {
+    "albums": 0,
+    "singles": 0,
+    "compilations": 0,
+    "appears_on": 0,
+    "top_tracks": {"$slice": 5},
+}
 
 
 def setup_argparse() -> argparse.ArgumentParser:
@@ -45,12 +57,17 @@ def setup_argparse() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--name",
-        help="Filter by artist name (case-insensitive)",
+        help="Filter by words in the artist name (case-insensitive)",
     )
     parser.add_argument(
         "--genre",
         help="Filter by genre (case-insensitive)",
     )
+    parser.add_argument(
+        "--exact",
+        action="store_true",
+        help="Match the whole name and genre rather than words or a substring",
+    )
     parser.add_argument(
         "--count",
         action="store_true",
@@ -119,6 +136,28 @@ def display_artist_summary(artist: dict[str, Any], console: Console) -> None:
     console.print(table)
 
 
+def release_table(title: str, releases: list[dict[str, Any]]) -> Table:
+    """Build a table listing albums or singles.
+
+    Args:
+        title: Table title
+        releases: Stored release summaries
+
+    Returns:
+        Table with a row per release
+    """
+    table = Table(title=title)
+
+    table.add_column("Name", style="green")
+    table.add_column("Release Date", style="cyan")
+    table.add_column("Tracks", style="magenta")
+
+    for release in releases:
+        table.add_row(release["name"], release["release_date"], str(release["total_tracks"]))
+
+    return table
+
+
 def display_artist_details(artist: dict[str, Any], console: Console) -> None:
     """Display detailed artist information.
 
@@ -165,41 +204,12 @@ def display_artist_details(artist: dict[str, Any], console: Console) -> None:
     if "last_updated" in artist:
         basic_table.add_row("Last Updated", artist["last_updated"])
 
-    console.print(basic_table)
-
-    # Albums table
-    if artist.get("albums"):
-        albums_table = Table(title="Albums")
-
-        albums_table.add_column("Name", style="green")
-        albums_table.add_column("Release Date", style="cyan")
-        albums_table.add_column("Tracks", style="magenta")
-
-        for album in artist["albums"]:
-            albums_table.add_row(
-                album["name"],
-                album["release_date"],
-                str(album["total_tracks"]),
-            )
-
-        console.print(albums_table)
-
-    # Singles table
-    if artist.get("singles") and len(artist["singles"]) > 0:
-        singles_table = Table(title="Singles")
+    tables: list[Table] = [basic_table]
 
-        singles_table.add_column("Name", style="green")
-        singles_table.add_column("Release Date", style="cyan")
-        singles_table.add_column("Tracks", style="magenta")
-
-        for single in artist["singles"]:
-            singles_table.add_row(
-                single["name"],
-                single["release_date"],
-                str(single["total_tracks"]),
-            )
-
-        console.print(singles_table)
+    # Album and single tables
+    for title, releases in (("Albums", artist.get("albums")), ("Singles", artist.get("singles"))):
+        if releases:
+            tables.append(release_table(title, releases))
 
     # Top tracks table
     if artist.get("top_tracks"):
@@ -211,16 +221,18 @@ def display_artist_details(artist: dict[str, Any], console: Console) -> None:
         top_tracks_table.add_column("Album", style="yellow")
 
         for i, track in enumerate(artist["top_tracks"], 1):
-            album_name = track.get("album", {}).get("name", "N/A") if track.get("album") else "N/A"
-
+            album = track.get("album") or {}
             top_tracks_table.add_row(
                 str(i),
                 track["name"],
                 str(track.get("popularity", "N/A")),
-                album_name,
+                album.get("name", "N/A"),
             )
 
-        console.print(top_tracks_table)
+        tables.append(top_tracks_table)
+
+    # Render all of the artist's tables in one print
+    console.print(Group(*tables))
 
 
 def find_artists(
@@ -228,33 +240,47 @@ def find_artists(
     name: str | None = None,
     genre: str | None = None,
     limit: int = 20,
-) -> list[dict[str, Any]]:
+    exact: bool = False,
+    projection: dict[str, Any] | None = None,
+) -> Cursor:
     """Find artists in the database.
 
     Args:
         mongo_client: MongoDB client
-        name: Filter by artist name (case-insensitive)
-        genre: Filter by genre (case-insensitive)
+        name: Filter by words in the artist name (case-insensitive)
+        genre: Filter by genre substring (case-insensitive)
         limit: Maximum number of artists to return
+        exact: If True, match whole values using the case-insensitive indexes
+        projection: Fields to include or exclude, or None for whole documents
 
     Returns:
-        List of matching artists
+        Cursor over matching artists, fetched in a single batch
     """
     db_collection = mongo_client.get_collection()
 
     # Build query
-    query = {}
-
-    if name:
-        query["name"] = {"$regex": name, "$options": "i"}
-
-    if genre:
-        query["genres"] = {"$regex": genre, "$options": "i"}
+    query: dict[str, Any] = {}
+
+    if exact:
+        # Equality under the case-insensitive collation is an index seek
+        if name:
+            query["name"] = name
+        if genre:
+            query["genres"] = genre
+    else:
+        # The name filter ensures the name text index, falling back to a regex
+        # without it; the genre is escaped so characters like "." match literally
+        if name:
+            query.update(mongo_client.name_filter(name))
+        if genre:
+            query["genres"] = Regex(re.escape(genre), "i")
 
     # Execute query
-    results = db_collection.find(query).limit(limit)
-
-    return list(results)
+    return (
+        db_collection.find(query, projection, collation=CASE_INSENSITIVE if exact else None)
+        .limit(limit)
+        .batch_size(limit)
+    )
 
 
 def main() -> None:
@@ -274,27 +300,39 @@ def main() -> None:
         console.print("Connecting to MongoDB...")
         mongo_client = MongoDBClient(args.mongo_uri, args.db_name, args.collection)
 
+        # Only the _id is needed to count, and the summary skips the release lists
+        if args.count:
+            projection = {"_id": 1}
+        elif args.details:
+            projection = None
+        else:
+            projection = SUMMARY_PROJECTION
+
         # Find artists
         artists = find_artists(
             mongo_client,
             args.name,
             args.genre,
             args.limit,
+            args.exact,
+            projection,
         )
 
-        # Display results
+        # Display results while the cursor is read
         if args.count:
-            console.print(f"[bold]Found {len(artists)} matching artists[/bold]")
+            console.print(f"[bold]Found {sum(1 for _ in artists)} matching artists[/bold]")
         else:
-            console.print(f"[bold]Found {len(artists)} matching artists:[/bold]")
-
+            found = 0
             for artist in artists:
+                found += 1
                 if args.details:
                     display_artist_details(artist, console)
                     console.print("\n")
                 else:
                     display_artist_summary(artist, console)
 
+            console.print(f"[bold]Found {found} matching artists[/bold]")
+
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {str(e)}")
         import traceback
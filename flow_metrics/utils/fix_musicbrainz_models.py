@@ -1,38 +1,25 @@
-from typing import Any
-
-from pydantic import BaseModel, Field, model_validator
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field
 
 from flow_metrics.models.musicbrainz import MusicBrainzReleaseGroup
 
 
 class MusicBrainzReleaseGroupList(BaseModel):
-    """List of MusicBrainz release groups."""
+    """List of MusicBrainz release groups.
+
+    The API returns the release groups and their count under different keys
+    depending on the endpoint; the validation aliases accept either.
+    """
 
-    count: int = Field(default=0, alias="release-group-count")
+    count: int = Field(
+        default=0,
+        alias="release-group-count",
+        validation_alias=AliasChoices("release-group-count", "count"),
+    )
     offset: int = Field(default=0)
     release_groups: list[MusicBrainzReleaseGroup] = Field(
         alias="release-groups",
+        validation_alias=AliasChoices("release-group-list", "release-groups"),
         default_factory=list,
     )
 
-    class Config:
-        populate_by_name = True
-        from_attributes = True
-
-    @model_validator(mode="before")
-    @classmethod
-    def validate_structure(cls, data: dict[str, Any]) -> dict[str, Any]:
-        """Handle variations in API response structure."""
-        # Handle both potential formats
-        # If release-group-list exists, map it to release-groups
-        if "release-group-list" in data:
-            data["release-groups"] = data.pop("release-group-list")
-
-        # Set default count and offset if not present
-        if "count" in data and "release-group-count" not in data:
-            data["release-group-count"] = data["count"]
-
-        if "offset" not in data:
-            data["offset"] = 0
-
-        return data
+    model_config = ConfigDict(populate_by_name=True, from_attributes=True)
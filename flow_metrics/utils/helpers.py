@@ -0,0 +1,49 @@
+"""General helper functions."""
+
+from typing import Any
+
+from flow_metrics.models.spotify import SpotifyAlbumSimplified
+
+# Appearances on other artists' releases stored per artist; prolific
+# featured artists can have thousands, which would bloat every upsert
+MAX_STORED_APPEARANCES = 100
+
+# Album fields copied as-is into the stored album summaries
+ALBUM_SUMMARY_FIELDS = frozenset({"id", "name", "release_date", "total_tracks", "album_type"})
+
+
+def build_page_params(
+    limit: int,
+    offset: int,
+    max_limit: int,
+    **optional: Any,
+) -> dict[str, Any]:
+    """Build query parameters for a paginated API endpoint.
+
+    Args:
+        limit: Requested page size
+        offset: Offset for pagination
+        max_limit: Largest page size accepted by the API
+        **optional: Additional parameters, included only when they are set
+
+    Returns:
+        Query parameters dict
+    """
+    params: dict[str, Any] = {"limit": min(limit, max_limit), "offset": offset}
+    params.update({key: value for key, value in optional.items() if value})
+    return params
+
+
+def summarize_album(album: SpotifyAlbumSimplified) -> dict[str, Any]:
+    """Convert an album into the simplified format stored in MongoDB.
+
+    Args:
+        album: Spotify album object
+
+    Returns:
+        Dictionary with the stored album fields
+    """
+    return {
+        **album.model_dump(include=ALBUM_SUMMARY_FIELDS),
+        "image": album.images[0].url if album.images else None,
+    }
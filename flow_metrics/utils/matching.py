@@ -1,13 +1,19 @@
 """Utilities for matching entities between different music APIs."""
 
+import heapq
+import math
 import re
-from difflib import SequenceMatcher
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any
 
+from rapidfuzz import fuzz, process
+
 from flow_metrics.clients.musicbrainz import MusicBrainzClient
 from flow_metrics.clients.spotify import SpotifyClient
 from flow_metrics.models.musicbrainz import (
     MusicBrainzArtist,
+    MusicBrainzRecordingList,
     MusicBrainzRelease,
     MusicBrainzReleaseGroup,
 )
@@ -20,7 +26,19 @@ from flow_metrics.models.spotify import (
 
 AlbumMatch = dict[str, Any]
 
+# Characters stripped from names before comparison, and runs of whitespace
+PUNCTUATION_RE = re.compile(r"[^\w\s]")
+WHITESPACE_RE = re.compile(r"\s+")
+
+# Threads used to send independent MusicBrainz searches; the client's rate
+# limiter still spaces the requests out
+SEARCH_WORKERS = 4
+
+# Spotify album counts reported when comparing artists
+ALBUM_COUNT_TYPES = frozenset({"album", "single", "compilation", "total"})
+
 
+@lru_cache(maxsize=4096)
 def normalize_name(name: str) -> str:
     """Normalize a name for comparison.
 
@@ -34,13 +52,30 @@ def normalize_name(name: str) -> str:
     name = name.lower()
 
     # Remove special characters and extra whitespace
-    name = re.sub(r"[^\w\s]", "", name)
-    return re.sub(r"\s+", " ", name).strip()
+    name = PUNCTUATION_RE.sub("", name)
+    return WHITESPACE_RE.sub(" ", name).strip()
 
 
 def name_similarity(name1: str, name2: str) -> float:
     """Calculate similarity between two names.
 
+    Args:
+        name1: First name
+        name2: Second name
+
+    Returns:
+        Similarity score (0-1)
+    """
+    # The score is symmetric, so order the pair to share one cache entry
+    if name2 < name1:
+        name1, name2 = name2, name1
+    return _cached_similarity(name1, name2)
+
+
+@lru_cache(maxsize=16384)
+def _cached_similarity(name1: str, name2: str) -> float:
+    """Calculate and cache the similarity between two ordered names.
+
     Args:
         name1: First name
         name2: Second name
@@ -52,15 +87,107 @@ def name_similarity(name1: str, name2: str) -> float:
     name1 = normalize_name(name1)
     name2 = normalize_name(name2)
 
-    # Calculate similarity
-    return SequenceMatcher(None, name1, name2).ratio()
+    # Calculate similarity; RapidFuzz's ratio is the normalized Indel similarity
+    # (based on the longest common subsequence), computed in native code. It is
+    # not difflib's Ratcliff/Obershelp ratio: scores often agree but can be
+    # higher, e.g. for transposed letters, so borderline names may now match.
+    return fuzz.ratio(name1, name2) / 100.0
+
+
+def length_window(length: int, similarity_threshold: float) -> tuple[float, float]:
+    """Get the range of name lengths that can reach a similarity threshold.
+
+    The similarity of two names is at most twice the shorter length over the
+    total length, so names outside this window cannot match a name of the
+    given length.
+
+    Args:
+        length: Length of the normalized name
+        similarity_threshold: Minimum similarity to consider a match
+
+    Returns:
+        Minimum and maximum normalized candidate length
+    """
+    if similarity_threshold <= 0:
+        return 0, math.inf
+
+    # Widened slightly so rounding never excludes a length on the boundary
+    return (
+        length * similarity_threshold / (2 - similarity_threshold) - 1e-9,
+        length * (2 - similarity_threshold) / similarity_threshold + 1e-9,
+    )
+
+
+def best_name_match(
+    name: str,
+    candidates: list[str],
+    similarity_threshold: float,
+) -> tuple[int, float] | None:
+    """Find the candidate name most similar to a name.
+
+    Args:
+        name: Name to match
+        candidates: Candidate names
+        similarity_threshold: Minimum similarity to consider a match
+
+    Returns:
+        Index and similarity score (0-1) of the best candidate, or None if no
+        candidate meets the threshold
+    """
+    return best_normalized_match(
+        normalize_name(name),
+        [normalize_name(candidate) for candidate in candidates],
+        similarity_threshold,
+    )
+
+
+def best_normalized_match(
+    query: str,
+    candidates: list[str],
+    similarity_threshold: float,
+) -> tuple[int, float] | None:
+    """Find the already normalized candidate most similar to a normalized name.
+
+    Callers matching several names against the same candidates normalize them
+    once and reuse the list. An exact match is returned straight away.
+    Otherwise candidates outside the name's length window are dropped, and the
+    rest are scored in a single native call.
+
+    Args:
+        query: Normalized name to match
+        candidates: Normalized candidate names
+        similarity_threshold: Minimum similarity to consider a match
+
+    Returns:
+        Index and similarity score (0-1) of the best candidate, or None if no
+        candidate meets the threshold
+    """
+    # Rounded so thresholds like 0.85 do not become 85.00000000000001
+    score_cutoff = round(similarity_threshold * 100, 9)
+    min_length, max_length = length_window(len(query), similarity_threshold)
+
+    # An identical normalized name is the best possible match, so it is returned
+    # without scoring; otherwise only candidates in the length window are scored
+    eligible: dict[int, str] = {}
+    for index, candidate in enumerate(candidates):
+        if candidate == query:
+            return index, 1.0
+        if min_length <= len(candidate) <= max_length:
+            eligible[index] = candidate
+
+    match = process.extractOne(query, eligible, scorer=fuzz.ratio, score_cutoff=score_cutoff)
+    if match is None:
+        return None
+
+    _, score, index = match
+    return index, score / 100.0
 
 
 def find_musicbrainz_artist(
     spotify_artist: SpotifyArtist,
     mb_client: MusicBrainzClient,
     similarity_threshold: float = 0.85,
-) -> MusicBrainzArtist | None:
+) -> tuple[MusicBrainzArtist, float] | None:
     """Find a MusicBrainz artist matching a Spotify artist.
 
     Args:
@@ -69,7 +196,8 @@ def find_musicbrainz_artist(
         similarity_threshold: Minimum name similarity to consider a match
 
     Returns:
-        Matching MusicBrainz artist or None if no match found
+        Matching MusicBrainz artist and its similarity score (0-1), or None if no
+        match found
     """
     # Search for artist by name
     results = mb_client.search_artists(spotify_artist.name)
@@ -77,22 +205,18 @@ def find_musicbrainz_artist(
     if not results.artists:
         return None
 
-    # Look for a match with high similarity
-    best_match = None
-    best_score = 0.0
-
-    for mb_artist in results.artists:
-        score = name_similarity(spotify_artist.name, mb_artist.name)
-
-        if score > best_score:
-            best_score = score
-            best_match = mb_artist
+    # Look for the most similar match that meets the threshold
+    match = best_name_match(
+        spotify_artist.name,
+        [mb_artist.name for mb_artist in results.artists],
+        similarity_threshold,
+    )
 
-    # Return the best match if it meets the threshold
-    if best_match and best_score >= similarity_threshold:
-        return best_match
+    if match is None:
+        return None
 
-    return None
+    index, score = match
+    return results.artists[index], score
 
 
 def find_musicbrainz_release(
@@ -100,7 +224,7 @@ def find_musicbrainz_release(
     mb_client: MusicBrainzClient,
     artist_id: str | None = None,
     similarity_threshold: float = 0.85,
-) -> MusicBrainzRelease | None:
+) -> tuple[MusicBrainzRelease, float] | None:
     """Find a MusicBrainz release matching a Spotify album.
 
     Args:
@@ -110,7 +234,8 @@ def find_musicbrainz_release(
         similarity_threshold: Minimum title similarity to consider a match
 
     Returns:
-        Matching MusicBrainz release or None if no match found
+        Matching MusicBrainz release and its similarity score (0-1), or None if no
+        match found
     """
     # Search for release by title
     query = spotify_album.name
@@ -123,22 +248,18 @@ def find_musicbrainz_release(
     if not results.releases:
         return None
 
-    # Look for a match with high similarity
-    best_match = None
-    best_score = 0.0
-
-    for mb_release in results.releases:
-        score = name_similarity(spotify_album.name, mb_release.title)
-
-        if score > best_score:
-            best_score = score
-            best_match = mb_release
+    # Look for the most similar match that meets the threshold
+    match = best_name_match(
+        spotify_album.name,
+        [mb_release.title for mb_release in results.releases],
+        similarity_threshold,
+    )
 
-    # Return the best match if it meets the threshold
-    if best_match and best_score >= similarity_threshold:
-        return best_match
+    if match is None:
+        return None
 
-    return None
+    index, score = match
+    return results.releases[index], score
 
 
 def find_musicbrainz_release_group(
@@ -146,7 +267,7 @@ def find_musicbrainz_release_group(
     mb_client: MusicBrainzClient,
     artist_id: str | None = None,
     similarity_threshold: float = 0.85,
-) -> MusicBrainzReleaseGroup | None:
+) -> tuple[MusicBrainzReleaseGroup, float] | None:
     """Find a MusicBrainz release group matching a Spotify album.
 
     Args:
@@ -156,7 +277,8 @@ def find_musicbrainz_release_group(
         similarity_threshold: Minimum title similarity to consider a match
 
     Returns:
-        Matching MusicBrainz release group or None if no match found
+        Matching MusicBrainz release group and its similarity score (0-1), or None if no
+        match found
     """
     # Search for release group by title
     query = spotify_album.name
@@ -169,22 +291,18 @@ def find_musicbrainz_release_group(
     if not results.release_groups:
         return None
 
-    # Look for a match with high similarity
-    best_match = None
-    best_score = 0.0
-
-    for mb_release_group in results.release_groups:
-        score = name_similarity(spotify_album.name, mb_release_group.title)
-
-        if score > best_score:
-            best_score = score
-            best_match = mb_release_group
+    # Look for the most similar match that meets the threshold
+    match = best_name_match(
+        spotify_album.name,
+        [mb_release_group.title for mb_release_group in results.release_groups],
+        similarity_threshold,
+    )
 
-    # Return the best match if it meets the threshold
-    if best_match and best_score >= similarity_threshold:
-        return best_match
+    if match is None:
+        return None
 
-    return None
+    index, score = match
+    return results.release_groups[index], score
 
 
 def find_track_matches(
@@ -206,35 +324,33 @@ def find_track_matches(
     """
     matches: dict[str, dict[str, Any]] = {}
 
-    for track in spotify_tracks:
-        # Search for recording by title
-        query = track.name
-
+    def search(track: SpotifyTrack) -> MusicBrainzRecordingList:
+        """Search for a recording by track title."""
         if artist_id:
-            results = mb_client.search_recordings(query, artist_id=artist_id)
-        else:
-            results = mb_client.search_recordings(query)
+            return mb_client.search_recordings(track.name, artist_id=artist_id)
+        return mb_client.search_recordings(track.name)
+
+    # Send the searches concurrently; results come back in track order
+    with ThreadPoolExecutor(max_workers=SEARCH_WORKERS) as executor:
+        search_results = list(executor.map(search, spotify_tracks))
 
+    for track, results in zip(spotify_tracks, search_results, strict=True):
         if not results.recordings:
             continue
 
-        # Look for a match with high similarity
-        best_match = None
-        best_score = 0.0
-
-        for mb_recording in results.recordings:
-            score = name_similarity(track.name, mb_recording.title)
-
-            if score > best_score:
-                best_score = score
-                best_match = mb_recording
+        # Add the most similar match if it meets the threshold
+        match = best_name_match(
+            track.name,
+            [mb_recording.title for mb_recording in results.recordings],
+            similarity_threshold,
+        )
 
-        # Add the best match if it meets the threshold
-        if best_match and best_score >= similarity_threshold:
+        if match:
+            index, score = match
             matches[track.id] = {
                 "spotify_track": track,
-                "musicbrainz_recording": best_match,
-                "similarity_score": best_score,
+                "musicbrainz_recording": results.recordings[index],
+                "similarity_score": score,
             }
 
     return matches
@@ -270,18 +386,19 @@ def compare_artist_data(
     spotify_stats = spotify_client.get_artist_stats(spotify_artist.id)
     mb_stats = mb_client.get_artist_info(mb_artist.id)
 
-    # Get album counts
+    # Get album counts, defaulting types the artist has none of to zero
     spotify_album_counts = {
         "album": 0,
         "single": 0,
         "compilation": 0,
         "total": 0,
+        **{
+            album_type: count
+            for album_type, count in spotify_stats.album_counts.items()
+            if album_type in ALBUM_COUNT_TYPES
+        },
     }
 
-    for album_type, count in spotify_stats.album_counts.items():
-        if album_type in spotify_album_counts:
-            spotify_album_counts[album_type] = count
-
     mb_album_counts = mb_stats["release_group_counts"]
 
     # Compare top albums/release groups
@@ -293,15 +410,29 @@ def compare_artist_data(
     # Match albums between platforms
     album_matches: list[AlbumMatch] = []
 
-    for spotify_album in spotify_albums[:10]:  # Limit to top 10 for performance
-        mb_match = find_musicbrainz_release_group(spotify_album, mb_client, mb_artist.id)
+    # Limit to the 10 most recent albums for performance. Release dates are
+    # ISO formatted at year, month or day precision, so they sort as strings.
+    top_albums = heapq.nlargest(10, spotify_albums, key=lambda album: album.release_date)
+
+    # Match against every release group fetched with the artist info instead of
+    # searching per album, normalizing their titles once for all albums
+    release_groups = mb_stats["all_release_groups"]
+    release_group_titles = [normalize_name(release_group.title) for release_group in release_groups]
+
+    for spotify_album in top_albums:
+        match = best_normalized_match(
+            normalize_name(spotify_album.name),
+            release_group_titles,
+            similarity_threshold=0.85,
+        )
 
-        if mb_match:
+        if match:
+            index, score = match
             album_matches.append(
                 {
                     "spotify_album": spotify_album,
-                    "musicbrainz_release_group": mb_match,
-                    "similarity_score": name_similarity(spotify_album.name, mb_match.title),
+                    "musicbrainz_release_group": release_groups[index],
+                    "similarity_score": score,
                 },
             )
 
@@ -3,14 +3,14 @@
 
 import argparse
 import os
+import queue
 import sys
-import time
+import threading
+from collections import defaultdict
+from functools import lru_cache
 from typing import Any
 
-from dotenv import load_dotenv
-from pymongo import MongoClient
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
 # Add the project root to the path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -19,7 +19,25 @@ from flow_metrics.clients.factory import create_musicbrainz_client, create_spoti
 from flow_metrics.clients.musicbrainz import MusicBrainzClient, MusicBrainzError
 from flow_metrics.clients.spotify import SpotifyClient, SpotifyError
 from flow_metrics.config.settings import get_settings
-from flow_metrics.models.spotify import SpotifyArtist
+from flow_metrics.models.musicbrainz import MusicBrainzArtistList
+from flow_metrics.models.spotify import SpotifyAlbumSimplified, SpotifyArtist
+from flow_metrics.utils.helpers import MAX_STORED_APPEARANCES, summarize_album
+
+# Number of artists written to MongoDB per bulk write
+UPSERT_BATCH_SIZE = 25
+
+# Genres that mark a search result as a hip-hop artist
+HIP_HOP_GENRES = frozenset({"hip hop", "rap", "trap", "drill"})
+
+# Track fields stored for an artist's top tracks, with a summary of the album
+TOP_TRACK_FIELDS = {
+    "id": True,
+    "name": True,
+    "popularity": True,
+    "explicit": True,
+    "duration_ms": True,
+    "album": {"id", "name", "release_date"},
+}
 
 
 def setup_argparse() -> argparse.ArgumentParser:
@@ -63,10 +81,12 @@ def connect_to_mongodb(uri: str, db_name: str) -> Any:
         db_name: Database name
 
     Returns:
-        MongoDB database object
+        MongoDB database object backed by the shared connection pool
     """
-    client = MongoClient(uri)
-    return client[db_name]
+    # Imported here so pymongo is only loaded once the arguments are valid
+    from flow_metrics.db.mongodb import get_mongo_client
+
+    return get_mongo_client(uri)[db_name]
 
 
 def search_hip_hop_artists(
@@ -107,11 +127,8 @@ def search_hip_hop_artists(
             )
 
             for artist in results:
-                # Check if we already have this artist
-                if artist.id not in artists_seen and (
-                    # Check if artist has hip-hop related genres
-                    any(genre in artist.genres for genre in ["hip hop", "rap", "trap", "drill"])
-                ):
+                # Skip artists we already have or without hip-hop related genres
+                if artist.id not in artists_seen and not HIP_HOP_GENRES.isdisjoint(artist.genres):
                     artists.append(artist)
                     artists_seen.add(artist.id)
 
@@ -120,12 +137,26 @@ def search_hip_hop_artists(
         except SpotifyError as e:
             print(f"Error searching for term '{term}': {e}")
 
-        # Add a small delay to avoid rate limiting
-        time.sleep(1)
-
     return artists
 
 
+@lru_cache(maxsize=1024)
+def search_musicbrainz_artists(mb_client: MusicBrainzClient, name: str) -> MusicBrainzArtistList:
+    """Search MusicBrainz for artists, reusing results for names already searched this run.
+
+    Args:
+        mb_client: MusicBrainz client
+        name: Artist name to search for
+
+    Returns:
+        Matching MusicBrainz artists
+
+    Raises:
+        MusicBrainzError: If the search fails; failures are not cached
+    """
+    return mb_client.search_artists(name)
+
+
 def get_artist_full_data(
     spotify_client: SpotifyClient,
     mb_client: MusicBrainzClient,
@@ -148,7 +179,7 @@ def get_artist_full_data(
         "name": artist.name,
         "genres": artist.genres,
         "spotify_popularity": artist.popularity,
-        "spotify_followers": getattr(artist.followers, "total", 0),
+        "spotify_followers": artist.followers.total if artist.followers else 0,
         "spotify_images": [img.url for img in artist.images] if artist.images else [],
         "albums": [],
         "singles": [],
@@ -167,104 +198,39 @@ def get_artist_full_data(
 
         # Get top tracks
         artist_data["top_tracks"] = [
-            {
-                "id": track.id,
-                "name": track.name,
-                "popularity": track.popularity,
-                "explicit": track.explicit,
-                "duration_ms": track.duration_ms,
-                "album": {
-                    "id": track.album.id,
-                    "name": track.album.name,
-                    "release_date": track.album.release_date,
-                }
-                if track.album
-                else None,
-            }
-            for track in stats.top_tracks
+            track.model_dump(include=TOP_TRACK_FIELDS) for track in stats.top_tracks
         ]
     except SpotifyError as e:
         console.print(f"[yellow]Warning:[/yellow] Could not get Spotify stats: {e}")
 
     # Get all artist albums
     try:
-        # Get albums
-        albums = spotify_client.get_all_artist_albums(
-            artist_id=artist.id,
-            album_types=["album"],
-        )
-
-        artist_data["albums"] = [
-            {
-                "id": album.id,
-                "name": album.name,
-                "release_date": album.release_date,
-                "total_tracks": album.total_tracks,
-                "album_type": album.album_type,
-                "image": album.images[0].url if album.images else None,
-            }
-            for album in albums
-        ]
-
-        # Get singles
-        singles = spotify_client.get_all_artist_albums(
-            artist_id=artist.id,
-            album_types=["single"],
-        )
-
-        artist_data["singles"] = [
-            {
-                "id": single.id,
-                "name": single.name,
-                "release_date": single.release_date,
-                "total_tracks": single.total_tracks,
-                "album_type": single.album_type,
-                "image": single.images[0].url if single.images else None,
-            }
-            for single in singles
-        ]
-
-        # Get compilations
-        compilations = spotify_client.get_all_artist_albums(
-            artist_id=artist.id,
-            album_types=["compilation"],
-        )
-
-        artist_data["compilations"] = [
-            {
-                "id": compilation.id,
-                "name": compilation.name,
-                "release_date": compilation.release_date,
-                "total_tracks": compilation.total_tracks,
-                "album_type": compilation.album_type,
-                "image": compilation.images[0].url if compilation.images else None,
-            }
-            for compilation in compilations
-        ]
-
-        # Get appearances
-        appearances = spotify_client.get_all_artist_albums(
+        # Fetch every group in one paginated listing and split it by the group
+        # the album is listed under for this artist
+        releases_by_group: dict[str, list[SpotifyAlbumSimplified]] = defaultdict(list)
+        for release in spotify_client.get_all_artist_albums(
             artist_id=artist.id,
-            album_types=["appears_on"],
-        )
-
-        artist_data["appears_on"] = [
-            {
-                "id": appearance.id,
-                "name": appearance.name,
-                "release_date": appearance.release_date,
-                "total_tracks": appearance.total_tracks,
-                "album_type": appearance.album_type,
-                "image": appearance.images[0].url if appearance.images else None,
-            }
-            for appearance in appearances
-        ]
+            album_types=["album", "single", "compilation", "appears_on"],
+        ):
+            releases_by_group[release.album_group or release.album_type].append(release)
+
+        # Limit appearances to keep document size reasonable
+        del releases_by_group["appears_on"][MAX_STORED_APPEARANCES:]
+
+        # Process album lists into simplified format for storage
+        for field, group in (
+            ("albums", "album"),
+            ("singles", "single"),
+            ("compilations", "compilation"),
+            ("appears_on", "appears_on"),
+        ):
+            artist_data[field] = list(map(summarize_album, releases_by_group[group]))
     except SpotifyError as e:
         console.print(f"[yellow]Warning:[/yellow] Could not get Spotify albums: {e}")
 
     # Try to find MusicBrainz data
     try:
-        mb_results = mb_client.search_artists(artist.name)
+        mb_results = search_musicbrainz_artists(mb_client, artist.name)
 
         if mb_results.artists:
             # Find the best match
@@ -273,7 +239,7 @@ def get_artist_full_data(
 
             for mb_artist in mb_results.artists:
                 # Use the score provided by MusicBrainz
-                score = getattr(mb_artist, "score", 0)
+                score = mb_artist.score or 0
                 if score > highest_score:
                     highest_score = score
                     best_match = mb_artist
@@ -304,33 +270,57 @@ def get_artist_full_data(
 def store_artist_data(
     db: Any,
     collection_name: str,
-    artist_data: dict[str, Any],
+    artists: list[dict[str, Any]],
 ) -> None:
-    """Store artist data in MongoDB.
+    """Store artist data in MongoDB, inserting or updating all artists in one bulk write.
 
     Args:
         db: MongoDB database
         collection_name: Collection name
-        artist_data: Artist data to store
+        artists: Artist data to store, each containing a spotify_id
     """
-    collection = db[collection_name]
+    if not artists:
+        return
 
-    # Check if artist already exists
-    existing = collection.find_one({"spotify_id": artist_data["spotify_id"]})
+    from pymongo import UpdateOne
 
-    if existing:
-        # Update existing document
-        collection.update_one(
-            {"spotify_id": artist_data["spotify_id"]},
-            {"$set": artist_data},
-        )
-    else:
-        # Insert new document
-        collection.insert_one(artist_data)
+    db[collection_name].bulk_write(
+        [
+            UpdateOne({"spotify_id": artist["spotify_id"]}, {"$set": artist}, upsert=True)
+            for artist in artists
+        ],
+        ordered=False,
+    )
+
+
+def write_artist_batches(
+    db: Any,
+    collection_name: str,
+    batches: "queue.Queue[list[dict[str, Any]] | None]",
+    console: Console,
+) -> None:
+    """Store batches of artists taken from a queue until it yields None.
+
+    Run in a background thread so each write overlaps with fetching the next
+    artists. A failed write is reported and does not stop later batches.
+
+    Args:
+        db: MongoDB database
+        collection_name: Collection name
+        batches: Queue of artist batches, ended by None
+        console: Rich console for output
+    """
+    while (batch := batches.get()) is not None:
+        try:
+            store_artist_data(db, collection_name, batch)
+        except Exception as e:
+            console.print(f"[yellow]Warning:[/yellow] Could not store {len(batch)} artists: {e}")
 
 
 def main() -> None:
     """Main function."""
+    from dotenv import load_dotenv
+
     # Load environment variables
     load_dotenv()
 
@@ -355,6 +345,11 @@ def main() -> None:
         console.print("Connecting to MongoDB...")
         db = connect_to_mongodb(mongo_uri, args.db_name)
 
+        from flow_metrics.db.mongodb import ARTIST_INDEXES
+
+        # Index the lookups made for every artist; this is a no-op if they exist
+        db[args.collection].create_indexes(ARTIST_INDEXES)
+
         # Create clients
         console.print("Initializing API clients...")
         spotify_client = create_spotify_client()
@@ -366,31 +361,51 @@ def main() -> None:
 
         console.print(f"Found {len(artists)} hip-hop artists.")
 
+        # Artists waiting to be written in the next bulk write, and the writer
+        # thread storing full batches while the next artists are fetched
+        pending: list[dict[str, Any]] = []
+        batches: queue.Queue[list[dict[str, Any]] | None] = queue.Queue(maxsize=4)
+        writer = threading.Thread(
+            target=write_artist_batches,
+            args=(db, args.collection, batches, console),
+            daemon=True,
+        )
+        writer.start()
+
         # Process each artist
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Processing artists...", total=len(artists))
-
-            for i, artist in enumerate(artists):
-                progress.update(
-                    task,
-                    description=f"Processing {artist.name} ({i + 1}/{len(artists)})",
-                )
-
-                # Get comprehensive artist data
-                artist_data = get_artist_full_data(spotify_client, mb_client, artist, console)
-
-                # Store in MongoDB
-                store_artist_data(db, args.collection, artist_data)
-
-                # Update progress
-                progress.advance(task)
-
-                # Respect rate limits
-                time.sleep(1)
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
+        try:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console,
+            ) as progress:
+                task = progress.add_task("Processing artists...", total=len(artists))
+
+                for i, artist in enumerate(artists):
+                    progress.update(
+                        task,
+                        description=f"Processing {artist.name} ({i + 1}/{len(artists)})",
+                    )
+
+                    # Get comprehensive artist data
+                    artist_data = get_artist_full_data(spotify_client, mb_client, artist, console)
+
+                    # Queue for storage, handing off a full batch to the writer
+                    pending.append(artist_data)
+                    if len(pending) >= UPSERT_BATCH_SIZE:
+                        batches.put(pending)
+                        pending = []
+
+                    # Update progress; the clients' rate limiters space out the
+                    # API requests, so there is no need to pause between artists
+                    progress.advance(task)
+        finally:
+            # Store what was collected, even if processing stopped early
+            batches.put(pending)
+            batches.put(None)
+            writer.join()
 
         console.print(f"[bold green]Successfully processed {len(artists)} artists![/bold green]")
 
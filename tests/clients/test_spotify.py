@@ -1,15 +1,16 @@
 """Tests for Spotify client."""
 
-import json
-import os
+from collections.abc import Mapping
+from types import MappingProxyType, SimpleNamespace
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+import orjson
 import pytest
-from requests import Response
 
 from flow_metrics.clients.spotify import SpotifyClient
 from flow_metrics.models.spotify import (
+    SpotifyAlbumSimplified,
     SpotifyArtist,
     SpotifyError,
     SpotifyExternalUrls,
@@ -18,321 +19,360 @@ from flow_metrics.models.spotify import (
 )
 
 
-# Helper function to load mock data from file
-def load_mock_data(filename: str) -> dict[Any, Any]:
-    """Load mock data from test fixtures."""
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    fixtures_dir = os.path.join(current_dir, "..", "fixtures")
-    filepath = os.path.join(fixtures_dir, filename)
+class _FakeResponse:
+    """Minimal stand-in for an HTTP response carrying a JSON body."""
 
-    if os.path.exists(filepath):
-        with open(filepath, encoding="utf-8") as f:
-            return json.load(f)
-    return {}
+    __slots__ = ("_payload", "content")
 
+    def __init__(self, payload: Mapping[str, Any]) -> None:
+        """Keep the payload and encode it as the response body."""
+        self._payload = payload
+        self.content = orjson.dumps(payload, default=dict)
 
-# Ensure fixtures directory exists
-def setup_fixtures_dir():
-    """Create fixtures directory if it doesn't exist."""
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    fixtures_dir = os.path.join(current_dir, "..", "fixtures")
-    os.makedirs(fixtures_dir, exist_ok=True)
+    def json(self) -> Any:
+        """Return the payload itself rather than decoding the body again."""
+        return self._payload
 
 
-class TestSpotifyClient:
-    """Tests for SpotifyClient class."""
+def _freeze(obj: Any) -> Any:
+    """Make a payload read-only so that tests can share it safely.
 
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        """Setup test environment."""
-        setup_fixtures_dir()
+    Dicts become MappingProxyType views and lists become tuples, recursively;
+    an attempt to modify a shared payload then raises TypeError.
+    """
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(value) for value in obj)
+    return obj
 
-    @pytest.fixture
-    def client(self):
-        """Create a Spotify client for testing."""
-        return SpotifyClient(client_id="test_client_id", client_secret="test_client_secret")
 
-    @pytest.fixture
-    def mock_token_response(self):
-        """Create a mock token response."""
-        response = MagicMock(spec=Response)
-        response.json.return_value = {
-            "access_token": "test_access_token",
-            "token_type": "Bearer",
-            "expires_in": 3600,
-            "scope": "",
-        }
-        return response
+# Response payloads, built once at import and shared by every test
+# Sub-objects repeated across payloads are shared rather than written out each time
+_ARTIST_EXTERNAL_URLS: Mapping[str, Any] = _freeze(
+    {
+        "spotify": "https://open.spotify.com/artist/test_artist_id",
+    },
+)
 
-    @pytest.fixture
-    def mock_artist_response(self):
-        """Create a mock artist response."""
-        response = MagicMock(spec=Response)
-        response.json.return_value = {
-            "id": "test_artist_id",
-            "name": "Test Artist",
-            "popularity": 85,
-            "type": "artist",
-            "uri": "spotify:artist:test_artist_id",
-            "href": "https://api.spotify.com/v1/artists/test_artist_id",
-            "external_urls": {
-                "spotify": "https://open.spotify.com/artist/test_artist_id",
+_ARTIST_FOLLOWERS: Mapping[str, Any] = _freeze(
+    {
+        "href": None,
+        "total": 12345678,
+    },
+)
+
+_ARTIST_REF: Mapping[str, Any] = _freeze(
+    {
+        "id": "test_artist_id",
+        "name": "Test Artist",
+        "type": "artist",
+        "uri": "spotify:artist:test_artist_id",
+        "href": "https://api.spotify.com/v1/artists/test_artist_id",
+        "external_urls": _ARTIST_EXTERNAL_URLS,
+    },
+)
+
+_TOKEN_PAYLOAD: Mapping[str, Any] = _freeze(
+    {
+        "access_token": "test_access_token",
+        "token_type": "Bearer",
+        "expires_in": 3600,
+        "scope": "",
+    },
+)
+
+_ARTIST_PAYLOAD: Mapping[str, Any] = _freeze(
+    {
+        "id": "test_artist_id",
+        "name": "Test Artist",
+        "popularity": 85,
+        "type": "artist",
+        "uri": "spotify:artist:test_artist_id",
+        "href": "https://api.spotify.com/v1/artists/test_artist_id",
+        "external_urls": _ARTIST_EXTERNAL_URLS,
+        "followers": _ARTIST_FOLLOWERS,
+        "genres": ["hip hop", "rap"],
+        "images": [
+            {
+                "height": 640,
+                "width": 640,
+                "url": "https://i.scdn.co/image/test_image_large",
             },
-            "followers": {
-                "href": None,
-                "total": 12345678,
+            {
+                "height": 300,
+                "width": 300,
+                "url": "https://i.scdn.co/image/test_image_medium",
             },
-            "genres": ["hip hop", "rap"],
-            "images": [
-                {
-                    "height": 640,
-                    "width": 640,
-                    "url": "https://i.scdn.co/image/test_image_large",
-                },
+        ],
+    },
+)
+
+_SEARCH_PAYLOAD: Mapping[str, Any] = _freeze(
+    {
+        "artists": {
+            "href": "https://api.spotify.com/v1/search?query=test&type=artist&offset=0&limit=1",
+            "items": [
                 {
-                    "height": 300,
-                    "width": 300,
-                    "url": "https://i.scdn.co/image/test_image_medium",
+                    "id": "test_artist_id",
+                    "name": "Test Artist",
+                    "popularity": 85,
+                    "type": "artist",
+                    "uri": "spotify:artist:test_artist_id",
+                    "href": "https://api.spotify.com/v1/artists/test_artist_id",
+                    "external_urls": _ARTIST_EXTERNAL_URLS,
+                    "followers": _ARTIST_FOLLOWERS,
+                    "genres": ["hip hop", "rap"],
+                    "images": [],
                 },
             ],
-        }
-        return response
+            "limit": 1,
+            "next": None,
+            "offset": 0,
+            "previous": None,
+            "total": 1,
+        },
+    },
+)
 
-    @pytest.fixture
-    def mock_search_response(self):
-        """Create a mock search response."""
-        response = MagicMock(spec=Response)
-        response.json.return_value = {
-            "artists": {
-                "href": "https://api.spotify.com/v1/search?query=test&type=artist&offset=0&limit=1",
-                "items": [
+_TOP_TRACKS_PAYLOAD: Mapping[str, Any] = _freeze(
+    {
+        "tracks": [
+            {
+                "id": "test_track_id_1",
+                "name": "Test Track 1",
+                "popularity": 90,
+                "duration_ms": 180000,
+                "explicit": True,
+                "type": "track",
+                "uri": "spotify:track:test_track_id_1",
+                "href": "https://api.spotify.com/v1/tracks/test_track_id_1",
+                "external_urls": {
+                    "spotify": "https://open.spotify.com/track/test_track_id_1",
+                },
+                "disc_number": 1,
+                "track_number": 1,
+                "preview_url": "https://p.scdn.co/mp3-preview/test_track_id_1",
+                "artists": [_ARTIST_REF],
+            },
+        ],
+    },
+)
+
+_ARTIST_ALBUMS_PAYLOAD: Mapping[str, Any] = _freeze(
+    {
+        "href": "https://api.spotify.com/v1/artists/test_artist_id/albums?offset=0&limit=2",
+        "items": [
+            {
+                "id": "test_album_id_1",
+                "name": "Test Album 1",
+                "album_type": "album",
+                "release_date": "2022-01-01",
+                "release_date_precision": "day",
+                "total_tracks": 12,
+                "type": "album",
+                "uri": "spotify:album:test_album_id_1",
+                "href": "https://api.spotify.com/v1/albums/test_album_id_1",
+                "external_urls": {
+                    "spotify": "https://open.spotify.com/album/test_album_id_1",
+                },
+                "images": [
                     {
-                        "id": "test_artist_id",
-                        "name": "Test Artist",
-                        "popularity": 85,
-                        "type": "artist",
-                        "uri": "spotify:artist:test_artist_id",
-                        "href": "https://api.spotify.com/v1/artists/test_artist_id",
-                        "external_urls": {
-                            "spotify": "https://open.spotify.com/artist/test_artist_id",
-                        },
-                        "followers": {
-                            "href": None,
-                            "total": 12345678,
-                        },
-                        "genres": ["hip hop", "rap"],
-                        "images": [],
+                        "height": 640,
+                        "width": 640,
+                        "url": "https://i.scdn.co/image/test_album_1_large",
                     },
                 ],
-                "limit": 1,
-                "next": None,
-                "offset": 0,
-                "previous": None,
-                "total": 1,
+                "artists": [_ARTIST_REF],
             },
-        }
-        return response
-
-    @pytest.fixture
-    def mock_top_tracks_response(self):
-        """Create a mock top tracks response."""
-        response = MagicMock(spec=Response)
-        response.json.return_value = {
-            "tracks": [
-                {
-                    "id": "test_track_id_1",
-                    "name": "Test Track 1",
-                    "popularity": 90,
-                    "duration_ms": 180000,
-                    "explicit": True,
-                    "type": "track",
-                    "uri": "spotify:track:test_track_id_1",
-                    "href": "https://api.spotify.com/v1/tracks/test_track_id_1",
-                    "external_urls": {
-                        "spotify": "https://open.spotify.com/track/test_track_id_1",
-                    },
-                    "disc_number": 1,
-                    "track_number": 1,
-                    "preview_url": "https://p.scdn.co/mp3-preview/test_track_id_1",
-                    "artists": [
-                        {
-                            "id": "test_artist_id",
-                            "name": "Test Artist",
-                            "type": "artist",
-                            "uri": "spotify:artist:test_artist_id",
-                            "href": "https://api.spotify.com/v1/artists/test_artist_id",
-                            "external_urls": {
-                                "spotify": "https://open.spotify.com/artist/test_artist_id",
-                            },
-                        },
-                    ],
+            {
+                "id": "test_album_id_2",
+                "name": "Test Album 2",
+                "album_type": "single",
+                "release_date": "2021-06-15",
+                "release_date_precision": "day",
+                "total_tracks": 1,
+                "type": "album",
+                "uri": "spotify:album:test_album_id_2",
+                "href": "https://api.spotify.com/v1/albums/test_album_id_2",
+                "external_urls": {
+                    "spotify": "https://open.spotify.com/album/test_album_id_2",
                 },
-            ],
-        }
-        return response
-
-    @pytest.fixture
-    def mock_artist_albums_response(self):
-        """Create a mock artist albums response."""
-        response = MagicMock(spec=Response)
-        response.json.return_value = {
-            "href": "https://api.spotify.com/v1/artists/test_artist_id/albums?offset=0&limit=2",
-            "items": [
-                {
-                    "id": "test_album_id_1",
-                    "name": "Test Album 1",
-                    "album_type": "album",
-                    "release_date": "2022-01-01",
-                    "release_date_precision": "day",
-                    "total_tracks": 12,
-                    "type": "album",
-                    "uri": "spotify:album:test_album_id_1",
-                    "href": "https://api.spotify.com/v1/albums/test_album_id_1",
-                    "external_urls": {
-                        "spotify": "https://open.spotify.com/album/test_album_id_1",
+                "images": [
+                    {
+                        "height": 640,
+                        "width": 640,
+                        "url": "https://i.scdn.co/image/test_album_2_large",
                     },
-                    "images": [
-                        {
-                            "height": 640,
-                            "width": 640,
-                            "url": "https://i.scdn.co/image/test_album_1_large",
-                        },
-                    ],
-                    "artists": [
-                        {
-                            "id": "test_artist_id",
-                            "name": "Test Artist",
-                            "type": "artist",
-                            "uri": "spotify:artist:test_artist_id",
-                            "href": "https://api.spotify.com/v1/artists/test_artist_id",
-                            "external_urls": {
-                                "spotify": "https://open.spotify.com/artist/test_artist_id",
-                            },
-                        },
-                    ],
+                ],
+                "artists": [_ARTIST_REF],
+            },
+        ],
+        "limit": 2,
+        "next": None,
+        "offset": 0,
+        "previous": None,
+        "total": 2,
+    },
+)
+
+_ALBUM_TRACKS_PAYLOAD: Mapping[str, Any] = _freeze(
+    {
+        "href": "https://api.spotify.com/v1/albums/test_album_id_1/tracks?offset=0&limit=2",
+        "items": [
+            {
+                "id": "test_track_id_1",
+                "name": "Test Track 1",
+                "duration_ms": 180000,
+                "explicit": True,
+                "type": "track",
+                "uri": "spotify:track:test_track_id_1",
+                "href": "https://api.spotify.com/v1/tracks/test_track_id_1",
+                "external_urls": {
+                    "spotify": "https://open.spotify.com/track/test_track_id_1",
                 },
-                {
-                    "id": "test_album_id_2",
-                    "name": "Test Album 2",
-                    "album_type": "single",
-                    "release_date": "2021-06-15",
-                    "release_date_precision": "day",
-                    "total_tracks": 1,
-                    "type": "album",
-                    "uri": "spotify:album:test_album_id_2",
-                    "href": "https://api.spotify.com/v1/albums/test_album_id_2",
-                    "external_urls": {
-                        "spotify": "https://open.spotify.com/album/test_album_id_2",
-                    },
-                    "images": [
-                        {
-                            "height": 640,
-                            "width": 640,
-                            "url": "https://i.scdn.co/image/test_album_2_large",
-                        },
-                    ],
-                    "artists": [
-                        {
-                            "id": "test_artist_id",
-                            "name": "Test Artist",
-                            "type": "artist",
-                            "uri": "spotify:artist:test_artist_id",
-                            "href": "https://api.spotify.com/v1/artists/test_artist_id",
-                            "external_urls": {
-                                "spotify": "https://open.spotify.com/artist/test_artist_id",
-                            },
-                        },
-                    ],
+                "disc_number": 1,
+                "track_number": 1,
+                "preview_url": "https://p.scdn.co/mp3-preview/test_track_id_1",
+                "artists": [_ARTIST_REF],
+            },
+            {
+                "id": "test_track_id_2",
+                "name": "Test Track 2",
+                "duration_ms": 240000,
+                "explicit": False,
+                "type": "track",
+                "uri": "spotify:track:test_track_id_2",
+                "href": "https://api.spotify.com/v1/tracks/test_track_id_2",
+                "external_urls": {
+                    "spotify": "https://open.spotify.com/track/test_track_id_2",
                 },
-            ],
-            "limit": 2,
-            "next": None,
-            "offset": 0,
-            "previous": None,
-            "total": 2,
-        }
-        return response
+                "disc_number": 1,
+                "track_number": 2,
+                "preview_url": "https://p.scdn.co/mp3-preview/test_track_id_2",
+                "artists": [_ARTIST_REF],
+            },
+        ],
+        "limit": 2,
+        "next": None,
+        "offset": 0,
+        "previous": None,
+        "total": 2,
+    },
+)
+
+
+# Payloads served as mock responses, by name. The token payload is not among
+# them, since authenticate needs a mutable copy.
+_PAYLOADS: dict[str, Mapping[str, Any]] = {
+    "artist": _ARTIST_PAYLOAD,
+    "search": _SEARCH_PAYLOAD,
+    "top_tracks": _TOP_TRACKS_PAYLOAD,
+    "artist_albums": _ARTIST_ALBUMS_PAYLOAD,
+    "album_tracks": _ALBUM_TRACKS_PAYLOAD,
+}
+
+# Albums and top tracks returned by the mocked calls in test_get_artist_stats.
+# The data is trusted, so the models are built without validation; nested
+# objects stay as plain dicts, which get_artist_stats does not read.
+_STATS_ALBUM_DICTS: list[dict[str, Any]] = [
+    {
+        "id": "test_album_id_1",
+        "name": "Test Album 1",
+        "album_type": "album",
+        "release_date": "2022-01-01",
+        "release_date_precision": "day",
+        "total_tracks": 12,
+        "type": "album",
+        "uri": "spotify:album:test_album_id_1",
+        "href": "https://api.spotify.com/v1/albums/test_album_id_1",
+        "external_urls": {
+            "spotify": "https://open.spotify.com/album/test_album_id_1",
+        },
+        "images": [],
+        "artists": [],
+    },
+    {
+        "id": "test_album_id_2",
+        "name": "Test Album 2",
+        "album_type": "single",
+        "release_date": "2021-06-15",
+        "release_date_precision": "day",
+        "total_tracks": 1,
+        "type": "album",
+        "uri": "spotify:album:test_album_id_2",
+        "href": "https://api.spotify.com/v1/albums/test_album_id_2",
+        "external_urls": {
+            "spotify": "https://open.spotify.com/album/test_album_id_2",
+        },
+        "images": [],
+        "artists": [],
+    },
+]
+
+_STATS_TRACK_DICTS: list[dict[str, Any]] = [
+    {
+        "id": "test_track_id_1",
+        "name": "Test Track 1",
+        "popularity": 90,
+        "duration_ms": 180000,
+        "explicit": True,
+        "disc_number": 1,
+        "track_number": 1,
+        "preview_url": "https://p.scdn.co/mp3-preview/test_track_id_1",
+        "type": "track",
+        "uri": "spotify:track:test_track_id_1",
+        "href": "https://api.spotify.com/v1/tracks/test_track_id_1",
+        "external_urls": {
+            "spotify": "https://open.spotify.com/track/test_track_id_1",
+        },
+        "artists": [],
+    },
+]
+
+_STATS_ALBUMS = [SpotifyAlbumSimplified.model_construct(**album) for album in _STATS_ALBUM_DICTS]
+_STATS_TOP_TRACKS = [SpotifyTrack.model_construct(**track) for track in _STATS_TRACK_DICTS]
+
+
+class TestSpotifyClient:
+    """Tests for SpotifyClient class."""
 
     @pytest.fixture
-    def mock_album_tracks_response(self):
-        """Create a mock album tracks response."""
-        response = MagicMock(spec=Response)
-        response.json.return_value = {
-            "href": "https://api.spotify.com/v1/albums/test_album_id_1/tracks?offset=0&limit=2",
-            "items": [
-                {
-                    "id": "test_track_id_1",
-                    "name": "Test Track 1",
-                    "duration_ms": 180000,
-                    "explicit": True,
-                    "type": "track",
-                    "uri": "spotify:track:test_track_id_1",
-                    "href": "https://api.spotify.com/v1/tracks/test_track_id_1",
-                    "external_urls": {
-                        "spotify": "https://open.spotify.com/track/test_track_id_1",
-                    },
-                    "disc_number": 1,
-                    "track_number": 1,
-                    "preview_url": "https://p.scdn.co/mp3-preview/test_track_id_1",
-                    "artists": [
-                        {
-                            "id": "test_artist_id",
-                            "name": "Test Artist",
-                            "type": "artist",
-                            "uri": "spotify:artist:test_artist_id",
-                            "href": "https://api.spotify.com/v1/artists/test_artist_id",
-                            "external_urls": {
-                                "spotify": "https://open.spotify.com/artist/test_artist_id",
-                            },
-                        },
-                    ],
-                },
-                {
-                    "id": "test_track_id_2",
-                    "name": "Test Track 2",
-                    "duration_ms": 240000,
-                    "explicit": False,
-                    "type": "track",
-                    "uri": "spotify:track:test_track_id_2",
-                    "href": "https://api.spotify.com/v1/tracks/test_track_id_2",
-                    "external_urls": {
-                        "spotify": "https://open.spotify.com/track/test_track_id_2",
-                    },
-                    "disc_number": 1,
-                    "track_number": 2,
-                    "preview_url": "https://p.scdn.co/mp3-preview/test_track_id_2",
-                    "artists": [
-                        {
-                            "id": "test_artist_id",
-                            "name": "Test Artist",
-                            "type": "artist",
-                            "uri": "spotify:artist:test_artist_id",
-                            "href": "https://api.spotify.com/v1/artists/test_artist_id",
-                            "external_urls": {
-                                "spotify": "https://open.spotify.com/artist/test_artist_id",
-                            },
-                        },
-                    ],
-                },
-            ],
-            "limit": 2,
-            "next": None,
-            "offset": 0,
-            "previous": None,
-            "total": 2,
-        }
-        return response
+    def client(self):
+        """Create a Spotify client for testing."""
+        return SpotifyClient(client_id="test_client_id", client_secret="test_client_secret")
+
+    @pytest.fixture
+    def http_mocks(self, monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+        """Replace HTTP requests and authentication with mocks for one test.
+
+        The mocks also carry a response factory, so a test builds only the
+        responses it uses, named as in _PAYLOADS.
+        """
+        mocks = SimpleNamespace(
+            get=MagicMock(),
+            post=MagicMock(),
+            authenticate=MagicMock(),
+            response=lambda name: _FakeResponse(_PAYLOADS[name]),
+        )
+        monkeypatch.setattr("flow_metrics.http.client.HttpClient.get", mocks.get)
+        monkeypatch.setattr("flow_metrics.http.client.HttpClient.post", mocks.post)
+        monkeypatch.setattr(
+            "flow_metrics.clients.spotify.SpotifyClient.authenticate",
+            mocks.authenticate,
+        )
+        return mocks
 
     @patch("flow_metrics.http.client.HttpClient.post")
     def test_authenticate(
         self,
         mock_post: MagicMock,
         client: MagicMock,
-        mock_token_response: MagicMock,
     ):
         """Test authentication."""
         # Setup
-        mock_post.return_value = mock_token_response
+        # authenticate adds expires_at to the token data, so it gets a mutable copy
+        mock_post.return_value = _FakeResponse(dict(_TOKEN_PAYLOAD))
 
         # Execute
         token = client.authenticate()
@@ -347,18 +387,14 @@ class TestSpotifyClient:
             params={"grant_type": "client_credentials"},
         )
 
-    @patch("flow_metrics.clients.spotify.SpotifyClient.authenticate")
-    @patch("flow_metrics.http.client.HttpClient.get")
     def test_get_artist(
         self,
-        mock_get: MagicMock,
-        mock_authenticate: MagicMock,
+        http_mocks: SimpleNamespace,
         client: MagicMock,
-        mock_artist_response: MagicMock,
     ):
         """Test getting artist details."""
         # Setup
-        mock_get.return_value = mock_artist_response
+        http_mocks.get.return_value = http_mocks.response("artist")
 
         # Execute
         artist = client.get_artist("test_artist_id")
@@ -369,21 +405,17 @@ class TestSpotifyClient:
         assert artist.popularity == 85
         assert "hip hop" in artist.genres
         assert artist.followers.total == 12345678
-        mock_authenticate.assert_called_once()
-        mock_get.assert_called_once_with("/artists/test_artist_id")
+        http_mocks.authenticate.assert_called_once()
+        http_mocks.get.assert_called_once_with("/artists/test_artist_id")
 
-    @patch("flow_metrics.clients.spotify.SpotifyClient.authenticate")
-    @patch("flow_metrics.http.client.HttpClient.get")
     def test_search_artists(
         self,
-        mock_get: MagicMock,
-        mock_authenticate: MagicMock,
+        http_mocks: SimpleNamespace,
         client: MagicMock,
-        mock_search_response: MagicMock,
     ):
         """Test searching for artists."""
         # Setup
-        mock_get.return_value = mock_search_response
+        http_mocks.get.return_value = http_mocks.response("search")
 
         # Execute
         artists = client.search_artists("test")
@@ -392,8 +424,8 @@ class TestSpotifyClient:
         assert len(artists) == 1
         assert artists[0].id == "test_artist_id"
         assert artists[0].name == "Test Artist"
-        mock_authenticate.assert_called_once()
-        mock_get.assert_called_once_with(
+        http_mocks.authenticate.assert_called_once()
+        http_mocks.get.assert_called_once_with(
             "/search",
             params={
                 "q": "test",
@@ -403,18 +435,14 @@ class TestSpotifyClient:
             },
         )
 
-    @patch("flow_metrics.clients.spotify.SpotifyClient.authenticate")
-    @patch("flow_metrics.http.client.HttpClient.get")
     def test_get_artist_top_tracks(
         self,
-        mock_get: MagicMock,
-        mock_authenticate: MagicMock,
+        http_mocks: SimpleNamespace,
         client: MagicMock,
-        mock_top_tracks_response: MagicMock,
     ):
         """Test getting artist top tracks."""
         # Setup
-        mock_get.return_value = mock_top_tracks_response
+        http_mocks.get.return_value = http_mocks.response("top_tracks")
 
         # Execute
         tracks = client.get_artist_top_tracks("test_artist_id")
@@ -425,24 +453,20 @@ class TestSpotifyClient:
         assert tracks[0].name == "Test Track 1"
         assert tracks[0].popularity == 90
         assert tracks[0].explicit is True
-        mock_authenticate.assert_called_once()
-        mock_get.assert_called_once_with(
+        http_mocks.authenticate.assert_called_once()
+        http_mocks.get.assert_called_once_with(
             "/artists/test_artist_id/top-tracks",
             params={"market": "US"},
         )
 
-    @patch("flow_metrics.clients.spotify.SpotifyClient.authenticate")
-    @patch("flow_metrics.http.client.HttpClient.get")
     def test_get_artist_albums(
         self,
-        mock_get: MagicMock,
-        mock_authenticate: MagicMock,
+        http_mocks: SimpleNamespace,
         client: MagicMock,
-        mock_artist_albums_response: MagicMock,
     ):
         """Test getting artist albums."""
         # Setup
-        mock_get.return_value = mock_artist_albums_response
+        http_mocks.get.return_value = http_mocks.response("artist_albums")
 
         # Execute
         albums_response = client.get_artist_albums("test_artist_id")
@@ -456,8 +480,8 @@ class TestSpotifyClient:
         assert albums_response.items[1].id == "test_album_id_2"
         assert albums_response.items[1].name == "Test Album 2"
         assert albums_response.items[1].album_type == "single"
-        mock_authenticate.assert_called_once()
-        mock_get.assert_called_once_with(
+        http_mocks.authenticate.assert_called_once()
+        http_mocks.get.assert_called_once_with(
             "/artists/test_artist_id/albums",
             params={
                 "limit": 20,
@@ -465,26 +489,22 @@ class TestSpotifyClient:
             },
         )
 
-    @patch("flow_metrics.clients.spotify.SpotifyClient.authenticate")
-    @patch("flow_metrics.http.client.HttpClient.get")
     def test_get_artist_albums_with_album_types(
         self,
-        mock_get: MagicMock,
-        mock_authenticate: MagicMock,
+        http_mocks: SimpleNamespace,
         client: MagicMock,
-        mock_artist_albums_response: MagicMock,
     ):
         """Test getting artist albums with album types filter."""
         # Setup
-        mock_get.return_value = mock_artist_albums_response
+        http_mocks.get.return_value = http_mocks.response("artist_albums")
         album_types = ["album", "single"]
 
         # Execute
         client.get_artist_albums("test_artist_id", album_types=album_types)
 
         # Assert
-        mock_authenticate.assert_called_once()
-        mock_get.assert_called_once_with(
+        http_mocks.authenticate.assert_called_once()
+        http_mocks.get.assert_called_once_with(
             "/artists/test_artist_id/albums",
             params={
                 "limit": 20,
@@ -493,18 +513,14 @@ class TestSpotifyClient:
             },
         )
 
-    @patch("flow_metrics.clients.spotify.SpotifyClient.authenticate")
-    @patch("flow_metrics.http.client.HttpClient.get")
     def test_get_album_tracks(
         self,
-        mock_get: MagicMock,
-        mock_authenticate: MagicMock,
+        http_mocks: SimpleNamespace,
         client: MagicMock,
-        mock_album_tracks_response: MagicMock,
     ):
         """Test getting album tracks."""
         # Setup
-        mock_get.return_value = mock_album_tracks_response
+        http_mocks.get.return_value = http_mocks.response("album_tracks")
 
         # Execute
         tracks_response = client.get_album_tracks("test_album_id_1")
@@ -516,8 +532,8 @@ class TestSpotifyClient:
         assert tracks_response.items[0].name == "Test Track 1"
         assert tracks_response.items[1].id == "test_track_id_2"
         assert tracks_response.items[1].name == "Test Track 2"
-        mock_authenticate.assert_called_once()
-        mock_get.assert_called_once_with(
+        http_mocks.authenticate.assert_called_once()
+        http_mocks.get.assert_called_once_with(
             "/albums/test_album_id_1/tracks",
             params={
                 "limit": 50,
@@ -553,62 +569,9 @@ class TestSpotifyClient:
         )
         mock_get_artist.return_value = artist
 
-        albums: list[dict[str, Any]] = [
-            {
-                "id": "test_album_id_1",
-                "name": "Test Album 1",
-                "album_type": "album",
-                "release_date": "2022-01-01",
-                "release_date_precision": "day",
-                "total_tracks": 12,
-                "type": "album",
-                "uri": "spotify:album:test_album_id_1",
-                "href": "https://api.spotify.com/v1/albums/test_album_id_1",
-                "external_urls": {
-                    "spotify": "https://open.spotify.com/album/test_album_id_1",
-                },
-                "images": [],
-                "artists": [],
-            },
-            {
-                "id": "test_album_id_2",
-                "name": "Test Album 2",
-                "album_type": "single",
-                "release_date": "2021-06-15",
-                "release_date_precision": "day",
-                "total_tracks": 1,
-                "type": "album",
-                "uri": "spotify:album:test_album_id_2",
-                "href": "https://api.spotify.com/v1/albums/test_album_id_2",
-                "external_urls": {
-                    "spotify": "https://open.spotify.com/album/test_album_id_2",
-                },
-                "images": [],
-                "artists": [],
-            },
-        ]
-        mock_all_albums.return_value = [SpotifyArtist.model_validate(album) for album in albums]
+        mock_all_albums.return_value = _STATS_ALBUMS
 
-        top_tracks: list[dict[str, Any]] = [
-            {
-                "id": "test_track_id_1",
-                "name": "Test Track 1",
-                "popularity": 90,
-                "duration_ms": 180000,
-                "explicit": True,
-                "disc_number": 1,
-                "track_number": 1,
-                "preview_url": "https://p.scdn.co/mp3-preview/test_track_id_1",
-                "type": "track",
-                "uri": "spotify:track:test_track_id_1",
-                "href": "https://api.spotify.com/v1/tracks/test_track_id_1",
-                "external_urls": {
-                    "spotify": "https://open.spotify.com/track/test_track_id_1",
-                },
-                "artists": [],
-            },
-        ]
-        mock_top_tracks.return_value = [SpotifyTrack.model_validate(track) for track in top_tracks]
+        mock_top_tracks.return_value = _STATS_TOP_TRACKS
 
         # Execute
         stats = client.get_artist_stats("test_artist_id")
@@ -634,21 +597,18 @@ class TestSpotifyClient:
             market="US",
         )
 
-    @patch("flow_metrics.clients.spotify.SpotifyClient.authenticate")
-    @patch("flow_metrics.http.client.HttpClient.get")
     def test_error_handling(
         self,
-        mock_get: MagicMock,
-        mock_authenticate: MagicMock,
+        http_mocks: SimpleNamespace,
         client: MagicMock,
     ):
         """Test error handling."""
         # Setup
-        mock_get.side_effect = Exception("API Error")
+        http_mocks.get.side_effect = Exception("API Error")
 
         # Execute and Assert
         with pytest.raises(SpotifyError) as excinfo:
             client.get_artist("test_artist_id")
 
         assert "Failed to get artist: API Error" in str(excinfo.value)
-        mock_authenticate.assert_called_once()
+        http_mocks.authenticate.assert_called_once()
@@ -0,0 +1,323 @@
+"""Tests for MongoDB client."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pymongo.errors import OperationFailure
+
+from flow_metrics.db import mongodb
+from flow_metrics.db.mongodb import CASE_INSENSITIVE, MongoDBClient
+
+
+class TestMongoDBClient:
+    """Tests for MongoDBClient class."""
+
+    @pytest.fixture(autouse=True)
+    def client_cache(self):
+        """Isolate the shared MongoClient cache between tests."""
+        with patch.dict(mongodb._client_cache, clear=True):
+            yield mongodb._client_cache
+
+    @pytest.fixture(autouse=True)
+    def indexed_collections(self):
+        """Forget which collections were indexed by earlier tests."""
+        mongodb._indexed_collections.clear()
+        yield mongodb._indexed_collections
+        mongodb._indexed_collections.clear()
+
+    @pytest.fixture
+    def collection(self):
+        """Create a mock MongoDB collection."""
+        return MagicMock()
+
+    @pytest.fixture
+    def client(self, collection):
+        """Create a MongoDB client whose collections are mocked."""
+        with (
+            patch("flow_metrics.db.mongodb.get_settings"),
+            patch("flow_metrics.db.mongodb.MongoClient"),
+        ):
+            client = MongoDBClient("mongodb://localhost:27017", "test_db", "artists")
+        client.get_collection = MagicMock(return_value=collection)
+        return client
+
+    def test_connection_pool_settings(self):
+        """Test the MongoClient is built with the configured pool and compression."""
+        # Setup
+        settings = MagicMock(mongo_max_pool_size=20, mongo_compressors="zstd,zlib")
+
+        # Execute
+        with (
+            patch("flow_metrics.db.mongodb.get_settings", return_value=settings),
+            patch("flow_metrics.db.mongodb.MongoClient") as mongo_client,
+        ):
+            MongoDBClient("mongodb://localhost:27017", "test_db", "pool_settings")
+
+        # Assert
+        kwargs = mongo_client.call_args.kwargs
+        assert mongo_client.call_args.args == ("mongodb://localhost:27017",)
+        assert kwargs["maxPoolSize"] == 20
+        assert kwargs["compressors"] == "zstd,zlib"
+        assert kwargs["retryWrites"] is True
+
+    def test_mongo_client_shared_per_uri(self):
+        """Test clients for the same URI reuse one MongoClient."""
+        # Execute
+        with (
+            patch("flow_metrics.db.mongodb.get_settings"),
+            patch(
+                "flow_metrics.db.mongodb.MongoClient",
+                side_effect=lambda *a, **kw: MagicMock(),
+            ) as mongo_client,
+        ):
+            first = MongoDBClient("mongodb://shared:27017", "test_db", "artists")
+            second = MongoDBClient("mongodb://shared:27017", "other_db", "artists")
+            other = MongoDBClient("mongodb://other:27017", "test_db", "artists")
+
+        # Assert
+        assert first.client is second.client
+        assert other.client is not first.client
+        assert mongo_client.call_count == 2
+
+    def test_close_mongo_clients(self, client_cache):
+        """Test closing the shared clients empties the cache."""
+        # Setup
+        shared = MagicMock()
+        client_cache["mongodb://shared:27017"] = shared
+
+        # Execute
+        mongodb.close_mongo_clients()
+
+        # Assert
+        shared.close.assert_called_once()
+        assert client_cache == {}
+
+    def test_init_does_not_create_indexes(self):
+        """Test creating a client leaves index creation to ensure_indexes."""
+        # Execute
+        with (
+            patch("flow_metrics.db.mongodb.get_settings"),
+            patch("flow_metrics.db.mongodb.MongoClient") as mongo_client,
+        ):
+            MongoDBClient("mongodb://localhost:27017", "test_db", "artists")
+
+        # Assert
+        collection = mongo_client.return_value.__getitem__.return_value.__getitem__.return_value
+        collection.create_indexes.assert_not_called()
+
+    def test_ensure_indexes_once_per_collection(self, client, collection):
+        """Test indexes are only created the first time for a collection."""
+        # Execute
+        client.ensure_indexes()
+        client.ensure_indexes()
+
+        # Assert
+        collection.create_indexes.assert_called_once()
+        indexes = collection.create_indexes.call_args.args[0]
+        index_names = [index.document["name"] for index in indexes]
+        assert index_names == [
+            "spotify_id_unique",
+            "name",
+            "name_ci",
+            "name_text",
+            "genres_name",
+            "genres_ci",
+            "spotify_popularity",
+        ]
+
+    def test_insert_many_artists_batches(self, client, collection):
+        """Test artists are inserted in batches of batch_size."""
+        # Setup
+        artists = [{"spotify_id": f"artist_{i}"} for i in range(5)]
+        collection.insert_many.side_effect = lambda docs, ordered: MagicMock(
+            inserted_ids=[doc["spotify_id"] for doc in docs],
+        )
+
+        # Execute
+        inserted_ids = client.insert_many_artists(artists, batch_size=2)
+
+        # Assert
+        assert inserted_ids == [f"artist_{i}" for i in range(5)]
+        assert collection.insert_many.call_count == 3
+        collection.insert_many.assert_called_with([{"spotify_id": "artist_4"}], ordered=False)
+
+    def test_upsert_artist_insert(self, client, collection):
+        """Test upserting a new artist reports an insert."""
+        # Setup
+        collection.update_one.return_value = MagicMock(upserted_id="new_id", modified_count=0)
+        artist = {"spotify_id": "test_artist_id", "name": "Test Artist"}
+
+        # Execute
+        result = client.upsert_artist(artist)
+
+        # Assert
+        assert result == {"operation": "insert", "inserted_id": "new_id"}
+        collection.update_one.assert_called_once_with(
+            {"spotify_id": "test_artist_id"},
+            {"$set": artist},
+            upsert=True,
+        )
+        collection.find_one.assert_not_called()
+
+    def test_upsert_artist_update(self, client, collection):
+        """Test upserting an existing artist reports an update."""
+        # Setup
+        collection.update_one.return_value = MagicMock(upserted_id=None, modified_count=1)
+
+        # Execute
+        result = client.upsert_artist({"spotify_id": "test_artist_id"})
+
+        # Assert
+        assert result == {"operation": "update", "modified_count": 1}
+
+    def test_bulk_upsert_artists(self, client, collection):
+        """Test bulk upserts are sent in one unordered bulk write."""
+        # Setup
+        collection.bulk_write.return_value = MagicMock(
+            upserted_count=1,
+            matched_count=1,
+            modified_count=1,
+        )
+        artists = [{"spotify_id": "artist_1"}, {"spotify_id": "artist_2"}]
+
+        # Execute
+        result = client.bulk_upsert_artists(artists)
+
+        # Assert
+        assert result == {"inserted_count": 1, "matched_count": 1, "modified_count": 1}
+        operations = collection.bulk_write.call_args.args[0]
+        assert len(operations) == 2
+        assert collection.bulk_write.call_args.kwargs == {"ordered": False}
+
+    def test_bulk_upsert_artists_empty(self, client, collection):
+        """Test bulk upserting nothing skips the database."""
+        assert client.bulk_upsert_artists([]) == {
+            "inserted_count": 0,
+            "matched_count": 0,
+            "modified_count": 0,
+        }
+        collection.bulk_write.assert_not_called()
+
+    def test_find_existing_spotify_ids(self, client, collection):
+        """Test existing IDs are found with a single $in query."""
+        # Setup
+        collection.find.return_value = iter([{"spotify_id": "nas_id"}])
+
+        # Execute
+        existing = client.find_existing_spotify_ids(["nas_id", "new_id"])
+
+        # Assert
+        assert existing == {"nas_id"}
+        collection.find.assert_called_once_with(
+            {"spotify_id": {"$in": ["nas_id", "new_id"]}},
+            {"spotify_id": 1, "_id": 0},
+        )
+
+    def test_find_artist_by_name_words(self, client, collection):
+        """Test name searches use a quoted text search phrase."""
+        # Execute
+        client.find_artist_by_name('Kendrick "K-Dot" Lamar', limit=10, skip=20)
+
+        # Assert
+        collection.find.assert_called_once_with(
+            {"$text": {"$search": '"Kendrick  K-Dot  Lamar"'}},
+            None,
+            skip=20,
+            limit=10,
+            batch_size=500,
+            collation=None,
+        )
+
+    def test_find_artist_by_name_ensures_text_index(self, client, collection):
+        """Test name searches create the name text index before querying."""
+        # Execute
+        client.find_artist_by_name("Lamar")
+
+        # Assert
+        collection.create_indexes.assert_called_once_with(mongodb.ARTIST_INDEXES)
+        assert collection.find.call_args.args[0] == {"$text": {"$search": '"Lamar"'}}
+
+    def test_find_artist_by_name_without_text_index(self, client, collection):
+        """Test name searches fall back to a substring regex without the text index."""
+        # Setup
+        collection.create_indexes.side_effect = OperationFailure("text index conflict")
+        collection.index_information.return_value = {"_id_": {}, "other_text": {}}
+
+        # Execute
+        client.find_artist_by_name("Run-D.M.C")
+
+        # Assert
+        assert collection.find.call_args.args[0] == {
+            "name": {"$regex": r"Run\-D\.M\.C", "$options": "i"},
+        }
+
+    def test_find_artist_by_name_existing_text_index(self, client, collection):
+        """Test name searches use an existing text index they could not create."""
+        # Setup
+        collection.create_indexes.side_effect = OperationFailure("not authorized")
+        collection.index_information.return_value = {"_id_": {}, "name_text": {}}
+
+        # Execute
+        client.find_artist_by_name("Lamar")
+
+        # Assert
+        assert collection.find.call_args.args[0] == {"$text": {"$search": '"Lamar"'}}
+
+    def test_find_artist_by_name_exact(self, client, collection):
+        """Test exact name searches use the case-insensitive collation."""
+        # Setup
+        collection.find.return_value = iter([{"name": "Nas"}])
+
+        # Execute
+        artists = client.find_artist_by_name_list("nas", exact=True)
+
+        # Assert
+        assert artists == [{"name": "Nas"}]
+        collection.find.assert_called_once_with(
+            {"name": "nas"},
+            None,
+            skip=0,
+            limit=0,
+            batch_size=500,
+            collation=CASE_INSENSITIVE,
+        )
+
+    def test_find_artists_by_genre_streams(self, client, collection):
+        """Test genre searches return the cursor rather than a materialized list."""
+        # Setup
+        cursor = iter([{"name": "Nas"}, {"name": "Jay-Z"}])
+        collection.find.return_value = cursor
+
+        # Execute
+        artists = client.find_artists_by_genre("hip hop")
+
+        # Assert
+        assert artists is cursor
+        assert next(artists) == {"name": "Nas"}
+
+    def test_find_artist_by_spotify_id_projection(self, client, collection):
+        """Test the projection is passed through to MongoDB."""
+        # Setup
+        collection.find_one.return_value = {"name": "Nas"}
+
+        # Execute
+        artist = client.find_artist_by_spotify_id("nas_id", projection={"name": 1, "_id": 0})
+
+        # Assert
+        assert artist == {"name": "Nas"}
+        collection.find_one.assert_called_once_with({"spotify_id": "nas_id"}, {"name": 1, "_id": 0})
+
+    def test_explain_plan(self, client):
+        """Test the query is explained with execution statistics."""
+        # Setup
+        client.db = MagicMock()
+
+        # Execute
+        client.explain_plan({"genres": "hip hop"})
+
+        # Assert
+        client.db.command.assert_called_once_with(
+            "explain",
+            {"find": "artists", "filter": {"genres": "hip hop"}},
+            verbosity="executionStats",
+        )
@@ -0,0 +1,209 @@
+"""Tests for HTTP client."""
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+from flow_metrics.http.client import (
+    DEFAULT_USER_AGENT,
+    AsyncHttpClient,
+    HeaderAdder,
+    HttpClient,
+    retry_delay,
+)
+from flow_metrics.http.disk_cache import DiskCache
+
+
+class TestHttpClient:
+    """Tests for HttpClient class."""
+
+    @pytest.fixture
+    def requests_seen(self):
+        """Collect the requests sent through the mock transport."""
+        return []
+
+    @pytest.fixture
+    def client(self, requests_seen):
+        """Create an HTTP client backed by a mock transport."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests_seen.append(request)
+            if request.url.path.endswith("/missing"):
+                return httpx.Response(404, json={"error": "not found"})
+            return httpx.Response(200, json={"ok": True})
+
+        client = HttpClient(base_url="https://api.example.com/v1")
+        client.session = httpx.Client(transport=httpx.MockTransport(handler))
+        return client
+
+    def test_get(self, client, requests_seen):
+        """Test a GET request is sent to the base URL with query params."""
+        # Execute
+        response = client.get("/items", params={"limit": 5})
+
+        # Assert
+        assert response.json() == {"ok": True}
+        assert len(requests_seen) == 1
+        assert str(requests_seen[0].url) == "https://api.example.com/v1/items?limit=5"
+        assert requests_seen[0].headers["User-Agent"].startswith("FlowMetrics/")
+
+    def test_get_json_model(self, client):
+        """Test the JSON body is validated straight into the given model."""
+
+        class Status(BaseModel):
+            ok: bool
+
+        # Execute
+        status = client.get_json_model("/status", Status)
+
+        # Assert
+        assert status == Status(ok=True)
+
+    def test_error_status_raises(self, client):
+        """Test 4xx responses raise an HTTP status error."""
+        with pytest.raises(httpx.HTTPStatusError):
+            client.get("/missing")
+
+    @patch("flow_metrics.http.client.time.sleep")
+    def test_throttled_request_is_retried(self, mock_sleep):
+        """Test 429 responses are retried after the Retry-After delay."""
+        # Setup
+        statuses = iter([429, 200])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(next(statuses), headers={"Retry-After": "2"}, json={})
+
+        client = HttpClient(base_url="https://api.example.com")
+        client.session = httpx.Client(transport=httpx.MockTransport(handler))
+
+        # Execute
+        response = client.get("/items")
+
+        # Assert
+        assert response.status_code == 200
+        mock_sleep.assert_called_once_with(2.0)
+
+    @patch("flow_metrics.http.client.time.sleep")
+    def test_throttled_retries_exhausted(self, mock_sleep):
+        """Test the error is raised once throttled retries run out."""
+        # Setup
+        client = HttpClient(base_url="https://api.example.com", max_retries=2)
+        client.session = httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(503)),
+        )
+
+        # Execute / Assert
+        with pytest.raises(httpx.HTTPStatusError):
+            client.get("/items")
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [0.5, 1.0]
+
+    def test_retry_delay_http_date(self):
+        """Test a Retry-After date in the past means retrying immediately."""
+        response = httpx.Response(503, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+
+        assert retry_delay(response, attempt=0, backoff_factor=0.5) == 0.0
+
+    def test_cached_response_revalidated(self):
+        """Test a cached response is reused when the server answers 304."""
+        # Setup
+        conditional = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            conditional.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, headers={"ETag": '"v1"'}, json={"name": "Nas"})
+
+        client = HttpClient(base_url="https://api.example.com", cache=True)
+        client.session = httpx.Client(transport=httpx.MockTransport(handler))
+
+        # Execute
+        first = client.get("/artist/1", params={"inc": "tags"})
+        second = client.get("/artist/1", params={"inc": "tags"})
+
+        # Assert
+        assert conditional == [None, '"v1"']
+        assert second is first
+        assert second.json() == {"name": "Nas"}
+
+    def test_disk_cache_answers_repeat_gets(self, tmp_path, requests_seen):
+        """Test responses stored in the disk cache are reused across clients."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests_seen.append(request)
+            return httpx.Response(200, json={"name": "Nas"})
+
+        def make_client() -> HttpClient:
+            disk_cache = DiskCache(str(tmp_path / "responses.sqlite3"), ttl=60)
+            client = HttpClient(base_url="https://api.example.com", disk_cache=disk_cache)
+            client.session = httpx.Client(transport=httpx.MockTransport(handler))
+            return client
+
+        # Execute
+        first = make_client().get("/artist/1", params={"inc": "tags", "fmt": "json"})
+        second = make_client().get("/artist/1", params={"fmt": "json", "inc": "tags"})
+
+        # Assert
+        assert len(requests_seen) == 1
+        assert second.json() == first.json() == {"name": "Nas"}
+
+    def test_added_headers_are_sent(self, client, requests_seen):
+        """Test headers added with HeaderAdder are sent with later requests."""
+        # Setup
+        HeaderAdder(client, {"Authorization": "Bearer token"}).add_headers()
+
+        # Execute
+        client.get("/items")
+
+        # Assert
+        assert requests_seen[0].headers["Authorization"] == "Bearer token"
+
+    def test_headers_not_shared(self):
+        """Test adding headers to one client leaves the caller's dict and others alone."""
+        # Setup
+        headers = {"Accept": "application/json"}
+        first = HttpClient(base_url="https://api.example.com", headers=headers)
+        second = HttpClient(base_url="https://api.example.com", headers=headers)
+
+        # Execute
+        HeaderAdder(first, {"Authorization": "Bearer token"}).add_headers()
+
+        # Assert
+        assert first.headers["authorization"] == "Bearer token"
+        assert first.headers["User-Agent"] == DEFAULT_USER_AGENT
+        assert "Authorization" not in second.headers
+        assert headers == {"Accept": "application/json"}
+
+    def test_context_manager_closes_session(self):
+        """Test the connection pool is closed when leaving the context."""
+        with HttpClient(base_url="https://api.example.com") as client:
+            assert not client.session.is_closed
+
+        assert client.session.is_closed
+
+
+class TestAsyncHttpClient:
+    """Tests for AsyncHttpClient class."""
+
+    def test_concurrent_gets(self):
+        """Test concurrent GET requests gathered on one client."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"page": request.url.params["offset"]})
+
+        async def fetch_pages() -> list[dict[str, str]]:
+            async with AsyncHttpClient(base_url="https://api.example.com") as client:
+                client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+                responses = await asyncio.gather(
+                    *(client.get("/items", params={"offset": offset}) for offset in (0, 50)),
+                )
+                return [response.json() for response in responses]
+
+        # Execute
+        pages = asyncio.run(fetch_pages())
+
+        # Assert
+        assert pages == [{"page": "0"}, {"page": "50"}]
@@ -0,0 +1,46 @@
+"""Tests for the rate limiter."""
+
+from unittest.mock import patch
+
+import pytest
+
+from flow_metrics.http.rate_limit import RateLimiter
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter class."""
+
+    @patch("flow_metrics.http.rate_limit.time.sleep")
+    @patch("flow_metrics.http.rate_limit.time.monotonic", return_value=100.0)
+    def test_burst_then_wait(self, mock_monotonic, mock_sleep):
+        """Test requests beyond the burst wait for tokens to refill."""
+        # Setup
+        limiter = RateLimiter(rate=2.0, burst=2)
+
+        # Execute
+        for _ in range(4):
+            limiter.acquire()
+
+        # Assert
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [0.5, 1.0]
+
+    @patch("flow_metrics.http.rate_limit.time.sleep")
+    @patch("flow_metrics.http.rate_limit.time.monotonic")
+    def test_tokens_refill(self, mock_monotonic, mock_sleep):
+        """Test an idle period refills the bucket."""
+        # Setup
+        mock_monotonic.return_value = 100.0
+        limiter = RateLimiter(rate=1.0)
+        limiter.acquire()
+
+        # Execute
+        mock_monotonic.return_value = 101.0
+        limiter.acquire()
+
+        # Assert
+        mock_sleep.assert_not_called()
+
+    def test_invalid_rate(self):
+        """Test a non-positive rate is rejected."""
+        with pytest.raises(ValueError, match="rate and burst must be positive"):
+            RateLimiter(rate=0)
@@ -0,0 +1,80 @@
+"""Tests for the view_artists script."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from bson.regex import Regex
+from pymongo.errors import OperationFailure
+
+from flow_metrics.db import mongodb
+from flow_metrics.db.mongodb import CASE_INSENSITIVE, MongoDBClient
+from flow_metrics.scripts.view_artists import find_artists
+
+
+class TestFindArtists:
+    """Tests for find_artists."""
+
+    @pytest.fixture(autouse=True)
+    def indexed_collections(self):
+        """Forget which collections were indexed by earlier tests."""
+        mongodb._indexed_collections.clear()
+        yield mongodb._indexed_collections
+        mongodb._indexed_collections.clear()
+
+    @pytest.fixture
+    def collection(self):
+        """Create a mock MongoDB collection."""
+        return MagicMock()
+
+    @pytest.fixture
+    def mongo_client(self, collection):
+        """Create a MongoDB client whose collections are mocked."""
+        with (
+            patch("flow_metrics.db.mongodb.get_settings"),
+            patch("flow_metrics.db.mongodb.get_mongo_client"),
+        ):
+            client = MongoDBClient("mongodb://localhost:27017", "test_db", "artists")
+        client.get_collection = MagicMock(return_value=collection)
+        return client
+
+    def test_name_uses_text_index(self, mongo_client, collection):
+        """Test name filters create the name text index and search through it."""
+        # Execute
+        find_artists(mongo_client, name="Lamar", genre="hip hop")
+
+        # Assert
+        collection.create_indexes.assert_called_once_with(mongodb.ARTIST_INDEXES)
+        collection.find.assert_called_once_with(
+            {"$text": {"$search": '"Lamar"'}, "genres": Regex("hip\\ hop", "i")},
+            None,
+            collation=None,
+        )
+
+    def test_name_without_text_index(self, mongo_client, collection):
+        """Test name filters fall back to a substring regex on an un-indexed collection."""
+        # Setup
+        collection.create_indexes.side_effect = OperationFailure("not authorized")
+        collection.index_information.return_value = {"_id_": {}}
+
+        # Execute
+        find_artists(mongo_client, name="kendr")
+
+        # Assert
+        collection.find.assert_called_once_with(
+            {"name": {"$regex": "kendr", "$options": "i"}},
+            None,
+            collation=None,
+        )
+
+    def test_exact_name_skips_text_index(self, mongo_client, collection):
+        """Test exact name filters use the collation rather than the text index."""
+        # Execute
+        find_artists(mongo_client, name="Nas", exact=True)
+
+        # Assert
+        collection.create_indexes.assert_not_called()
+        collection.find.assert_called_once_with(
+            {"name": "Nas"},
+            None,
+            collation=CASE_INSENSITIVE,
+        )
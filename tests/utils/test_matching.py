@@ -0,0 +1,87 @@
+"""Tests for name matching utilities."""
+
+import inspect
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from flow_metrics.utils.matching import (
+    find_musicbrainz_artist,
+    find_musicbrainz_release,
+    find_musicbrainz_release_group,
+    find_track_matches,
+    name_similarity,
+)
+
+# Threshold the find_musicbrainz_* helpers match names against by default
+DEFAULT_THRESHOLD = 0.85
+
+
+class TestNameMatching:
+    """Tests for the similarity scores behind the MusicBrainz matching helpers."""
+
+    def test_default_thresholds(self):
+        """Test the matching helpers keep their default similarity threshold."""
+        # Setup
+        helpers = [
+            find_musicbrainz_artist,
+            find_musicbrainz_release,
+            find_musicbrainz_release_group,
+            find_track_matches,
+        ]
+
+        # Execute
+        defaults = {
+            helper.__name__: inspect.signature(helper).parameters["similarity_threshold"].default
+            for helper in helpers
+        }
+
+        # Assert
+        assert defaults == dict.fromkeys(defaults, DEFAULT_THRESHOLD)
+
+    def test_name_similarity_scores(self):
+        """Test scores of names either side of the default threshold."""
+        # Setup
+        expected = {
+            ("Jay-Z", "Jay Z"): 0.8889,
+            ("Lil Wayne", "Lil Wayne Jr"): 0.8571,
+            ("Eminem", "Eminen"): 0.8333,
+            ("De La Soul", "De La Soul Band"): 0.8,
+            # Transposed letters score higher than with difflib, which gave 0.8
+            ("Gang Starr", "Gnga Starr"): 0.9,
+            ("Ice Cube", "Cube Ice"): 0.625,
+        }
+
+        # Execute
+        scores = {pair: name_similarity(*pair) for pair in expected}
+
+        # Assert
+        assert scores == {pair: pytest.approx(score, abs=1e-4) for pair, score in expected.items()}
+
+    def test_name_similarity_symmetric(self):
+        """Test the score does not depend on the order of the names."""
+        # Execute and Assert
+        assert name_similarity("Gnga Starr", "Gang Starr") == name_similarity(
+            "Gang Starr",
+            "Gnga Starr",
+        )
+
+    def test_find_musicbrainz_artist_at_threshold(self):
+        """Test artists match only when their score reaches the default threshold."""
+        # Setup
+        mb_client = MagicMock()
+        mb_client.search_artists.return_value = SimpleNamespace(
+            artists=[SimpleNamespace(name="Eminen"), SimpleNamespace(name="Lil Wayne Jr")],
+        )
+
+        # Execute
+        below = find_musicbrainz_artist(SimpleNamespace(name="Eminem"), mb_client)
+        above = find_musicbrainz_artist(SimpleNamespace(name="Lil Wayne"), mb_client)
+
+        # Assert
+        assert below is None
+        assert above is not None
+        mb_artist, score = above
+        assert mb_artist.name == "Lil Wayne Jr"
+        assert score == pytest.approx(0.8571, abs=1e-4)